@@ -0,0 +1,189 @@
+# adapters/_cache.py
+"""
+AmpyFin — Val Model
+Small in-process TTL cache for adapter results.
+
+Several strategies need the same ticker's metrics, and several adapters read
+the same provider objects; memoizing for a few minutes keeps a run from
+hitting the network twice for identical data. Only successful results are
+cached — failures are retried on the next call.
+
+Fundamentals (statements, multi-year EPS history, share counts) change at
+most once a quarter, so those adapters also persist results across runs with
+disk_cache(): one small JSON file per (adapter, ticker) under
+$AMPYFIN_CACHE_DIR (default ./.cache). The TTL is chosen per adapter (a week
+for revenue and EPS history, 90 days for shares outstanding); prices are
+never persisted. Set AMPYFIN_DISK_CACHE=0 to bypass it.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire `ttl` seconds after insertion."""
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 300.0) -> None:
+        self.maxsize = int(maxsize)
+        self.ttl = float(ttl)
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at <= now:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+_MISSING = object()
+
+
+def ttl_cache(maxsize: int = 4096, ttl: float = 300.0) -> Callable:
+    """
+    Decorator for MetricAdapter.fetch(self, ticker): memoizes the returned value
+    keyed on (adapter name, TICKER). Exceptions are not cached.
+    The underlying cache is exposed as `wrapper.cache`.
+    """
+    cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, ticker: str) -> float:
+            key = (self.get_name(), str(ticker).upper())
+            hit = cache.get(key, _MISSING)
+            if hit is not _MISSING:
+                return hit
+            value = func(self, ticker)
+            cache.set(key, value)
+            return value
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
+
+
+def memoize(cache: TTLCache, key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return cache[key], building it with factory() on a miss."""
+    hit: Optional[Any] = cache.get(key, _MISSING)
+    if hit is not _MISSING:
+        return hit
+    value = factory()
+    cache.set(key, value)
+    return value
+
+
+# ---------------------------------------------------------------------------
+# On-disk cache
+# ---------------------------------------------------------------------------
+
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+def _disk_cache_enabled() -> bool:
+    return os.getenv("AMPYFIN_DISK_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _disk_cache_path(adapter_name: str, ticker: str) -> str:
+    root = os.getenv("AMPYFIN_CACHE_DIR", ".cache")
+    name = _UNSAFE_FILENAME_CHARS.sub("_", str(ticker).upper())
+    return os.path.join(root, _UNSAFE_FILENAME_CHARS.sub("_", adapter_name), f"{name}.json")
+
+
+def _read_disk(path: str, ttl: float) -> Any:
+    try:
+        with open(path, "rb") as fh:
+            entry = json.loads(fh.read())
+        if time.time() - float(entry["t"]) < ttl:
+            return entry["v"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return _MISSING
+
+
+def _write_disk(path: str, value: Any) -> None:
+    # Write to a temp file and rename so concurrent readers never see a partial file
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w") as fh:
+            json.dump({"t": time.time(), "v": value}, fh)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        pass  # the cache is best-effort
+
+
+def cached(adapter_name: str, ticker: str, ttl: float, fn: Callable[[], Any]) -> Any:
+    """
+    Return the on-disk value for (adapter_name, TICKER) if younger than `ttl`
+    seconds, else call fn(), store its (JSON-serializable) result and return it.
+    Exceptions from fn() propagate and nothing is written.
+    """
+    if not _disk_cache_enabled():
+        return fn()
+    path = _disk_cache_path(adapter_name, ticker)
+    hit = _read_disk(path, ttl)
+    if hit is not _MISSING:
+        return hit
+    value = fn()
+    _write_disk(path, value)
+    return value
+
+
+def disk_lookup(adapter_name: str, ticker: str, ttl: float) -> Any:
+    """On-disk value for (adapter_name, TICKER) if younger than `ttl` seconds, else None."""
+    if not _disk_cache_enabled():
+        return None
+    hit = _read_disk(_disk_cache_path(adapter_name, ticker), ttl)
+    return None if hit is _MISSING else hit
+
+
+def disk_store(adapter_name: str, ticker: str, value: Any) -> None:
+    """Write `value` for (adapter_name, TICKER), e.g. results of a batch request."""
+    if _disk_cache_enabled():
+        _write_disk(_disk_cache_path(adapter_name, ticker), value)
+
+
+def disk_cache(ttl: float) -> Callable:
+    """Decorator form of cached() for MetricAdapter.fetch(self, ticker)."""
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(self, ticker: str) -> float:
+            return cached(self.get_name(), ticker, ttl, lambda: func(self, ticker))
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,32 @@
+# adapters/_env.py
+"""
+AmpyFin — Val Model
+Process-wide environment lookups for the adapters.
+
+.env is loaded once, here, the first time any adapter needs a credential
+(non-fatal if python-dotenv is missing). Values are then read once and
+memoized, so building adapters per run or per ticker never re-parses .env or
+re-queries the environment.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from typing import Optional
+
+try:
+    from dotenv import load_dotenv  # type: ignore
+    load_dotenv()
+except Exception:
+    pass
+
+
+@functools.lru_cache(maxsize=None)
+def env(key: str) -> Optional[str]:
+    """os.getenv(key), memoized for the life of the process."""
+    return os.getenv(key)
+
+
+FMP_API_KEY = env("FINANCIAL_PREP_API_KEY")
+POLYGON_API_KEY = env("POLYGON_API_KEY")
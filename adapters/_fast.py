@@ -0,0 +1,64 @@
+# adapters/_fast.py
+"""
+AmpyFin — Val Model
+Scalar coercion helpers used on every adapter's parse path.
+
+Every value read from a provider payload (JSON numbers, strings, numpy
+scalars from pandas rows) goes through one of these. The module is plain,
+fully annotated Python with no dynamic tricks so it can optionally be
+compiled with mypyc:
+
+    mypyc adapters/_fast.py
+
+The compiled extension (adapters/_fast.*.so) takes import precedence over
+this file; without it the pure-Python version is used unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, Optional, Tuple
+
+
+_INF = float("inf")
+
+
+def to_float(v: object) -> Optional[float]:
+    """
+    float(v), or None for None / NaN / +-inf / anything float() rejects.
+    One-element pandas objects (e.g. a row lookup that hit one cell) are unwrapped.
+    """
+    t = type(v)
+    if t is float:  # common case: already parsed as a JSON number
+        f: float = v  # type: ignore[assignment]
+        return f if f == f and f != _INF and f != -_INF else None
+    if t is int:
+        return float(v)  # type: ignore[arg-type]
+    if v is None:
+        return None
+    if hasattr(v, "iloc"):
+        try:
+            v = v.iloc[0]  # type: ignore[attr-defined]
+        except Exception:
+            return None
+    try:
+        f = float(v)  # type: ignore[arg-type]
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return f if f == f and f != _INF and f != -_INF else None
+
+
+def to_positive_float(v: object) -> Optional[float]:
+    """Like to_float(), but also None for values <= 0 (prices, share counts)."""
+    f = to_float(v)
+    if f is None or f <= 0.0:
+        return None
+    return f
+
+
+def pick(row: Mapping[str, Any], keys: Tuple[str, ...]) -> Optional[float]:
+    """First non-NaN numeric value among row[k] for k in keys, else None."""
+    for k in keys:
+        f = to_float(row.get(k))
+        if f is not None:
+            return f
+    return None
@@ -0,0 +1,48 @@
+# adapters/_fmp.py
+"""
+AmpyFin — Val Model
+Helpers shared by the FinancialModelingPrep adapters.
+
+FMP field names drift between endpoints and API versions, so adapters look a
+value up under several candidate keys. Candidate keys are module-level tuples
+in each adapter; pick() (adapters._fast) walks them with a numeric fast path.
+
+The revenue, EBIT and gross-profit TTM adapters (and last-quarter revenue)
+all read the same quarterly income statement; income_statement() memoizes
+successful responses briefly so they share one round trip per ticker.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+from adapters._cache import TTLCache
+from adapters._http import get_session, loads
+
+HTTP_TIMEOUT = 15
+INCOME_STATEMENT_URL = "https://financialmodelingprep.com/api/v3/income-statement/{tk}"
+
+_INCOME_CACHE = TTLCache(maxsize=2048, ttl=300.0)
+
+
+def income_statement(ticker: str, api_key: str, period: str = "quarter", limit: int = 4) -> Tuple[int, Any]:
+    """
+    GET /income-statement/{TICKER}. Returns (status_code, parsed_json_or_None).
+    Successful (HTTP 200) payloads are cached for a few minutes.
+    """
+    tk = ticker.upper()
+    key = (tk, period, int(limit))
+    hit = _INCOME_CACHE.get(key)
+    if hit is not None:
+        return 200, hit
+
+    resp = get_session(http2=True).get(
+        INCOME_STATEMENT_URL.format(tk=tk),
+        params={"period": period, "limit": limit, "apikey": api_key},
+        timeout=HTTP_TIMEOUT,
+    )
+    if resp.status_code != 200:
+        return resp.status_code, None
+    data = loads(resp.content)
+    _INCOME_CACHE.set(key, data)
+    return 200, data
@@ -0,0 +1,291 @@
+# adapters/_http.py
+"""
+AmpyFin — Val Model
+Shared HTTP session for the REST adapters (FMP, Polygon, ...).
+
+One pooled requests.Session lives for the whole process so repeated calls
+reuse keep-alive connections instead of paying a TCP+TLS handshake per fetch.
+Adapters keep their own retry/error semantics; the transport never retries.
+
+Response bodies are parsed with loads(resp.content): orjson when installed,
+stdlib json otherwise (both accept bytes, so no text decode is needed).
+
+FMP adapters ask for get_session(http2=True). When httpx with HTTP/2 support
+(httpx[http2]) is installed they get a shared HTTP/2 client, so concurrent
+requests from the fetch thread pool multiplex over one TLS connection;
+otherwise they fall back to the pooled requests session. Adapters only rely on
+the common surface of both (get(url, params=, timeout=, headers=),
+status_code, content).
+
+All transports cap in-flight requests per host (MAX_IN_FLIGHT_PER_HOST), so
+a wide fetch_many() fan-out cannot burst past a provider's rate limit no
+matter how many worker threads are running. The sync cap is adaptive: each
+429/503 from a host lowers its limit by one, and it climbs back one step per
+THROTTLE_RECOVERY successful responses. The async client applies the same
+adaptive cap with AsyncAdaptiveAdmission, so waiting coroutines park on the
+loop instead of blocking a thread.
+
+Adapters with a native async path (MetricAdapter.fetch_async overrides) use
+get_async_client(): one shared httpx.AsyncClient per running event loop, so a
+single loop can keep many requests in flight without worker threads. Callers
+that own the loop (the async fetch stage) release it with close_async_client().
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    def loads(data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+except ImportError:  # pragma: no cover
+    import json
+
+    def loads(data: bytes | str) -> Any:
+        return json.loads(data)
+
+try:
+    import httpx  # optional: HTTP/2 transport
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
+MAX_IN_FLIGHT_PER_HOST = 8
+THROTTLE_STATUSES = (429, 503)
+THROTTLE_RECOVERY = 20  # successful responses per +1 step back toward the cap
+
+
+class AdaptiveAdmission:
+    """
+    Counting admission gate with a limit that can change while requests are in
+    flight (a Semaphore's cannot). Use as a context manager around a request,
+    then report the outcome with observe(status_code).
+    """
+
+    def __init__(self, limit: int, recovery: int = THROTTLE_RECOVERY) -> None:
+        self._cond = threading.Condition()
+        self._ceiling = max(1, int(limit))
+        self._limit = self._ceiling
+        self._recovery = max(1, int(recovery))
+        self._active = 0
+        self._ok = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    def __enter__(self) -> "AdaptiveAdmission":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.release()
+
+    def set_limit(self, n: int) -> None:
+        """Clamp to [1, initial limit]; waiters re-check immediately."""
+        with self._cond:
+            self._set_limit_locked(n)
+
+    def _set_limit_locked(self, n: int) -> None:
+        self._limit = max(1, min(self._ceiling, int(n)))
+        self._ok = 0
+        self._cond.notify_all()
+
+    def observe(self, status_code: int) -> None:
+        """Shrink by one on a throttling status, grow back slowly on success."""
+        with self._cond:
+            if status_code in THROTTLE_STATUSES:
+                # read-modify-write under the lock: concurrent 429s each count
+                self._set_limit_locked(self._limit - 1)
+                return
+            if self._limit >= self._ceiling:
+                return
+            self._ok += 1
+            if self._ok >= self._recovery:
+                self._ok = 0
+                self._limit += 1
+                self._cond.notify()
+
+
+class AsyncAdaptiveAdmission:
+    """
+    asyncio counterpart of AdaptiveAdmission: use with `async with` around a
+    request, then `await observe(status_code)`. Create it inside the event loop
+    that uses it.
+    """
+
+    def __init__(self, limit: int, recovery: int = THROTTLE_RECOVERY) -> None:
+        self._cond = asyncio.Condition()
+        self._ceiling = max(1, int(limit))
+        self._limit = self._ceiling
+        self._recovery = max(1, int(recovery))
+        self._active = 0
+        self._ok = 0
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    async def __aenter__(self) -> "AsyncAdaptiveAdmission":
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    async def observe(self, status_code: int) -> None:
+        """Shrink by one on a throttling status, grow back slowly on success."""
+        async with self._cond:
+            if status_code in THROTTLE_STATUSES:
+                self._limit = max(1, self._limit - 1)
+                self._ok = 0
+                return
+            if self._limit >= self._ceiling:
+                return
+            self._ok += 1
+            if self._ok >= self._recovery:
+                self._ok = 0
+                self._limit += 1
+                self._cond.notify()
+
+
+_host_slots: Dict[str, AdaptiveAdmission] = {}
+_host_slots_lock = threading.Lock()
+
+
+def host_slot(host: str) -> AdaptiveAdmission:
+    """Admission gate bounding concurrent requests to `host`."""
+    slot = _host_slots.get(host)
+    if slot is None:
+        with _host_slots_lock:
+            slot = _host_slots.setdefault(host, AdaptiveAdmission(MAX_IN_FLIGHT_PER_HOST))
+    return slot
+
+
+class _HostLimitedAdapter(HTTPAdapter):
+    def send(self, request, *args, **kwargs):  # type: ignore[override]
+        slot = host_slot(urlsplit(request.url).hostname or "")
+        with slot:
+            resp = super().send(request, *args, **kwargs)
+        slot.observe(resp.status_code)
+        return resp
+
+
+def _build_session() -> requests.Session:
+    s = requests.Session()
+    s.headers.update(HEADERS)
+    adapter = _HostLimitedAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def _build_http2_client() -> Any:
+    if httpx is None:
+        return None
+
+    class _HostLimitedTransport(httpx.HTTPTransport):
+        def handle_request(self, request):  # type: ignore[override]
+            slot = host_slot(request.url.host)
+            with slot:
+                resp = super().handle_request(request)
+            slot.observe(resp.status_code)
+            return resp
+
+    try:
+        transport = _HostLimitedTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+        )
+    except ImportError:  # httpx present but the h2 package is not
+        return None
+    return httpx.Client(headers=HEADERS, timeout=15.0, transport=transport)
+
+
+SESSION = _build_session()
+HTTP2_CLIENT = _build_http2_client()
+
+# httpx.AsyncClient is bound to the loop it first runs on, hence one per loop
+_ASYNC_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+def get_session(http2: bool = False) -> Any:
+    """
+    Return the process-wide pooled session. With http2=True, prefer the shared
+    HTTP/2 client when available (falls back to the requests session).
+    """
+    if http2 and HTTP2_CLIENT is not None:
+        return HTTP2_CLIENT
+    return SESSION
+
+
+def _build_async_client() -> Any:
+    class _HostLimitedAsyncTransport(httpx.AsyncHTTPTransport):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            # Created inside the loop that owns this client
+            self._slots: Dict[str, AsyncAdaptiveAdmission] = {}
+
+        async def handle_async_request(self, request):  # type: ignore[override]
+            slot = self._slots.get(request.url.host)
+            if slot is None:
+                slot = self._slots.setdefault(request.url.host, AsyncAdaptiveAdmission(MAX_IN_FLIGHT_PER_HOST))
+            async with slot:
+                resp = await super().handle_async_request(request)
+            await slot.observe(resp.status_code)
+            return resp
+
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    try:
+        transport = _HostLimitedAsyncTransport(http2=True, limits=limits)
+    except ImportError:  # no h2: HTTP/1.1 keep-alive still pools connections
+        transport = _HostLimitedAsyncTransport(limits=limits)
+    return httpx.AsyncClient(headers=HEADERS, timeout=15.0, transport=transport)
+
+
+def get_async_client() -> Optional[Any]:
+    """
+    Shared httpx.AsyncClient for the running event loop (HTTP/2 when the h2
+    package is installed), or None when httpx is not installed.
+    Must be called from inside a coroutine.
+    """
+    if httpx is None:
+        return None
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        client = _ASYNC_CLIENTS[loop] = _build_async_client()
+    return client
+
+
+async def close_async_client() -> None:
+    """Close the running loop's shared AsyncClient, if one was created."""
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
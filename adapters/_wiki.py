@@ -0,0 +1,53 @@
+# adapters/_wiki.py
+"""
+AmpyFin — Val Model
+Column extraction for the Wikipedia index-constituent tickers adapters.
+
+The adapters need one column (Symbol / Ticker) out of one table. Parsing the
+page with lxml and walking that table's rows directly avoids pd.read_html,
+which turns every table on the page into a DataFrame first. One module-level
+HTMLParser is reused; it skips the id index, comments and processing
+instructions, none of which the extraction needs. Only class="wikitable"
+tables are considered (infoboxes and navboxes never hold constituents);
+pages without any fall back to every table.
+"""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import lxml.etree
+import lxml.html
+
+_PARSER = lxml.html.HTMLParser(collect_ids=False, remove_comments=True, remove_pis=True)
+_WIKITABLES = lxml.etree.XPath("//table[contains(concat(' ', normalize-space(@class), ' '), ' wikitable ')]")
+
+
+def _cells(tr) -> list:
+    return tr.xpath("./th|./td")
+
+
+def table_column(content: bytes, names: Tuple[str, ...]) -> Optional[List[str]]:
+    """
+    Cell texts (stripped) of the first table whose header row has a column
+    named like one of `names` (case-insensitive, earlier names preferred).
+    Returns None when no table on the page has such a column.
+    """
+    wanted = [n.lower() for n in names]
+    doc = lxml.etree.fromstring(content, _PARSER)
+    for table in _WIKITABLES(doc) or doc.iter("table"):
+        rows = table.xpath("./tr|./thead/tr|./tbody/tr")
+        if not rows:
+            continue
+        header = [c.text_content().strip().lower() for c in _cells(rows[0])]
+        idx = next((header.index(n) for n in wanted if n in header), None)
+        if idx is None:
+            continue
+        out: List[str] = []
+        for tr in rows[1:]:
+            cells = _cells(tr)
+            # skip repeated header rows (all <th>)
+            if len(cells) > idx and any(c.tag == "td" for c in cells):
+                out.append(cells[idx].text_content().strip())
+        return out
+    return None
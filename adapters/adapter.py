@@ -11,9 +11,17 @@ Rules:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import random
+import threading
 import time
 from abc import ABC, abstractmethod
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from tenacity import Retrying, stop_after_attempt, wait_random_exponential
 
 
 class AdapterError(RuntimeError):
@@ -24,80 +32,164 @@ class DataNotAvailable(AdapterError):
     """Raised when the provider cannot supply the requested data."""
 
 
+# Longest server-requested pause honoured before retrying (seconds)
+MAX_RETRY_AFTER = 60.0
+
+
+def retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """
+    Seconds requested by a Retry-After header on the HTTP response attached to
+    `exc` (or to an exception it was raised from), else None. Both the
+    delta-seconds and HTTP-date forms are accepted.
+    """
+    while exc is not None:
+        headers = getattr(getattr(exc, "response", None), "headers", None)
+        value = headers.get("Retry-After") if headers is not None else None
+        if value:
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+            try:
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+
 def retry_on_failure(max_retries=3, delay=2.0):
-    """Decorator to retry adapter fetch operations on failure."""
+    """
+    Decorator to retry adapter fetch operations on failure.
+
+    Uses "full jitter": each wait is drawn uniformly from [0, delay * 2**n]
+    (the ceiling capped at 8x delay), so tickers that fail together spread their
+    retries out instead of retrying in lockstep.
+    When the failure carries a Retry-After header (429/503), that pause is
+    used instead (capped at MAX_RETRY_AFTER), plus the same jitter.
+    """
+    backoff = wait_random_exponential(multiplier=float(delay), max=float(delay) * 8)
+
+    def wait(retry_state) -> float:
+        hinted = retry_after_seconds(retry_state.outcome.exception())
+        if hinted is None:
+            return backoff(retry_state)
+        return min(hinted, MAX_RETRY_AFTER) + random.uniform(0, float(delay))
+
+    # Built once at decoration time; tenacity keeps per-call state in RetryCallState
+    retrying = Retrying(
+        stop=stop_after_attempt(max(1, int(max_retries))),
+        wait=wait,
+        reraise=True,
+    )
+
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(self, ticker: str) -> float:
-            last_exception = None
-            for attempt in range(max_retries):
-                try:
-                    return func(self, ticker)
-                except DataNotAvailable as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        time.sleep(delay)
-                        continue
-                    raise
-                except Exception as e:
-                    last_exception = e
-                    if attempt < max_retries - 1:
-                        time.sleep(delay)
-                        continue
-                    raise DataNotAvailable(f"{self._name}: failed after {max_retries} attempts") from e
-            raise last_exception
+            # Surface the provider error from the final attempt as DataNotAvailable
+            try:
+                return retrying(func, self, ticker)
+            except DataNotAvailable:
+                raise
+            except Exception as e:
+                raise DataNotAvailable(f"{self._name}: failed after {max_retries} attempts") from e
         return wrapper
     return decorator
 
 
+_RATE_LIMIT_STATUSES = frozenset((429, 999))  # 999: Yahoo's "request denied"
+_RATE_LIMIT_PHRASES = ('rate limit', 'too many requests', 'rate limited', 'possibly rate limited')
+
+try:  # yfinance raises a dedicated type for Yahoo 429s
+    from yfinance.exceptions import YFRateLimitError
+
+    _RATE_LIMIT_TYPES: tuple = (YFRateLimitError,)
+except ImportError:  # pragma: no cover
+    _RATE_LIMIT_TYPES = ()
+
+
+def is_rate_limited(exc: Optional[BaseException]) -> bool:
+    """
+    True when `exc` (or an exception it was raised from) is a rate-limit
+    error: a known rate-limit type or an HTTP response with a throttling
+    status. Only exceptions carrying neither are classified by message.
+    """
+    e = exc
+    while e is not None:
+        if isinstance(e, _RATE_LIMIT_TYPES):
+            return True
+        status = getattr(getattr(e, "response", None), "status_code", None)
+        if status is not None:
+            return status in _RATE_LIMIT_STATUSES
+        e = e.__cause__ or e.__context__
+    msg = str(exc).lower()
+    return any(phrase in msg for phrase in _RATE_LIMIT_PHRASES)
+
+
 def retry_on_rate_limit(max_retries=3, base_delay=5.0):
-    """Decorator to retry adapter fetch operations specifically on rate limiting."""
+    """
+    Decorator to retry adapter fetch operations specifically on rate limiting.
+
+    Waits for the server's Retry-After when the error carries one (capped at
+    MAX_RETRY_AFTER), otherwise backs off via yf_session.handle_rate_limit().
+    Other errors are not retried.
+    """
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(self, ticker: str) -> float:
-            last_exception = None
             for attempt in range(max_retries):
                 try:
                     return func(self, ticker)
-                except DataNotAvailable as e:
-                    # Check if this is a rate limiting error
-                    error_msg = str(e).lower()
-                    if any(phrase in error_msg for phrase in ['rate limit', 'too many requests', 'rate limited', 'possibly rate limited']):
-                        last_exception = e
-                        if attempt < max_retries - 1:
-                            # Use the session management rate limiting handler
-                            from adapters.yf_session import handle_rate_limit
-                            handle_rate_limit()
-                            continue
-                        else:
-                            raise DataNotAvailable(f"{self._name}: rate limited after {max_retries} attempts") from e
-                    else:
-                        # Not a rate limiting error, re-raise immediately
-                        raise
                 except Exception as e:
-                    # Check if this is a rate limiting error from yfinance
-                    error_msg = str(e).lower()
-                    if any(phrase in error_msg for phrase in ['rate limit', 'too many requests', 'rate limited', 'possibly rate limited']):
-                        last_exception = e
-                        if attempt < max_retries - 1:
-                            # Use the session management rate limiting handler
-                            from adapters.yf_session import handle_rate_limit
-                            handle_rate_limit()
-                            continue
-                        else:
-                            raise DataNotAvailable(f"{self._name}: rate limited after {max_retries} attempts") from e
-                    else:
-                        # Not a rate limiting error, re-raise immediately
+                    if not is_rate_limited(e):
+                        if isinstance(e, DataNotAvailable):
+                            raise
                         raise DataNotAvailable(f"{self._name}: failed after {max_retries} attempts") from e
-            raise last_exception
+                    if attempt == max_retries - 1:
+                        raise DataNotAvailable(f"{self._name}: rate limited after {max_retries} attempts") from e
+                    hinted = retry_after_seconds(e)
+                    if hinted is not None:
+                        time.sleep(min(hinted, MAX_RETRY_AFTER))
+                    else:
+                        from adapters.yf_session import handle_rate_limit
+                        handle_rate_limit()
+            raise DataNotAvailable(f"{self._name}: rate limited after {max_retries} attempts")
         return wrapper
     return decorator
 
 
+# One worker pool serves every fetch_many() call (all metrics, all batch
+# chunks) instead of a pool being started and torn down per call; threads are
+# spawned on demand up to this bound. Per-call concurrency is still capped.
+FETCH_POOL_WORKERS = 64
+_fetch_pool: Optional[ThreadPoolExecutor] = None
+_fetch_pool_lock = threading.Lock()
+
+
+def fetch_pool() -> ThreadPoolExecutor:
+    """The shared thread pool behind MetricAdapter.fetch_many()."""
+    global _fetch_pool
+    if _fetch_pool is None:
+        with _fetch_pool_lock:
+            if _fetch_pool is None:
+                _fetch_pool = ThreadPoolExecutor(max_workers=FETCH_POOL_WORKERS, thread_name_prefix="fetch")
+    return _fetch_pool
+
+
 class MetricAdapter(ABC):
     """
     Contract for single-metric adapters (e.g., current price, EPS TTM, FCF TTM).
     Implementations must return a numeric value (float).
+
+    Batch helpers fan a list of tickers out concurrently so network latency
+    overlaps across tickers: fetch_many() on a thread pool (the GIL is released
+    during socket I/O), fetch_many_async() for callers already in an event loop.
+    Per-ticker results are either a float or the exception raised for that ticker.
     """
 
+    # Upper bound on in-flight fetches when fanning out over many tickers.
+    max_concurrency: int = 8
+
     @abstractmethod
     def get_name(self) -> str:
         """Human-readable adapter name (e.g., 'yfinance_current_price')."""
@@ -111,6 +203,69 @@ class MetricAdapter(ABC):
         """
         raise NotImplementedError
 
+    async def fetch_async(self, ticker: str) -> float:
+        """
+        Awaitable variant of fetch(). The default runs the blocking fetch() on
+        the shared fetch pool (wider than the loop's default executor, which
+        would otherwise cap every sync adapter in an async run at ~cpu+4
+        threads); adapters with a native async transport may override it.
+        """
+        return await asyncio.get_running_loop().run_in_executor(fetch_pool(), self.fetch, ticker)
+
+    async def fetch_many_async(
+        self, tickers: Iterable[str], concurrency: Optional[int] = None
+    ) -> Dict[str, float | BaseException]:
+        """
+        Fetch many tickers concurrently (bounded by a semaphore).
+        Returns {ticker: value-or-exception}; one failure never aborts the batch.
+        """
+        symbols = list(dict.fromkeys(tickers))
+        sem = asyncio.Semaphore(max(1, int(concurrency or self.max_concurrency)))
+
+        async def _one(tk: str) -> float:
+            async with sem:
+                return await self.fetch_async(tk)
+
+        results = await asyncio.gather(*(_one(tk) for tk in symbols), return_exceptions=True)
+        return dict(zip(symbols, results))
+
+    def _safe_fetch(self, ticker: str) -> float | BaseException:
+        try:
+            return self.fetch(ticker)
+        except Exception as e:
+            return e
+
+    def fetch_many(
+        self, tickers: Iterable[str], concurrency: Optional[int] = None
+    ) -> Dict[str, float | BaseException]:
+        """
+        Fetch many tickers concurrently on the shared fetch pool.
+        Returns {ticker: value-or-exception}; one failure never aborts the batch.
+        fetch() must not call fetch_many() itself (it would wait on its own pool).
+        """
+        symbols = list(dict.fromkeys(tickers))
+        if not symbols:
+            return {}
+        workers = max(1, min(int(concurrency or self.max_concurrency), len(symbols)))
+        results: List[Any] = [None] * len(symbols)
+        todo = iter(range(len(symbols)))
+        lock = threading.Lock()
+
+        # `workers` drainers pull tickers off one queue, so this call never has
+        # more than `workers` fetches in flight however large the pool is
+        def drain() -> None:
+            while True:
+                with lock:
+                    i = next(todo, None)
+                if i is None:
+                    return
+                results[i] = self._safe_fetch(symbols[i])
+
+        pool = fetch_pool()
+        for fut in [pool.submit(drain) for _ in range(workers)]:
+            fut.result()
+        return dict(zip(symbols, results))
+
 
 class TickersAdapter(ABC):
     """
@@ -1,22 +1,13 @@
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
+from adapters._cache import ttl_cache
+from adapters._env import FMP_API_KEY
+from adapters._fast import to_float
+from adapters._http import get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
 
-def _to_float(x: Any) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        f = float(x)
-        if f != f:
-            return None
-        return f
-    except Exception:
-        return None
+_TTM_URL = "https://financialmodelingprep.com/api/v3/key-metrics-ttm/{tk}?apikey={k}"
+_LATEST_URL = "https://financialmodelingprep.com/api/v3/key-metrics/{tk}?limit=1&apikey={k}"
 
 
 class FMPBVPSAdapter(MetricAdapter):
@@ -33,37 +24,36 @@ class FMPBVPSAdapter(MetricAdapter):
 
     def __init__(self) -> None:
         self._name = "fmp_book_value_per_share"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
+    @ttl_cache(ttl=300)
     @retry_on_failure(max_retries=2, delay=0.5)
     def fetch(self, ticker: str) -> float:
         tk = ticker.upper()
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY") or os.getenv("FINANCIAL_PREP_API_KEY".upper())
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: FINANCIAL_PREP_API_KEY missing")
 
-        sess = requests.Session()
-        sess.headers.update({"User-Agent": "ampyfin/1.0"})
+        sess = get_session(http2=True)
 
         # Try TTM first
-        url1 = f"https://financialmodelingprep.com/api/v3/key-metrics-ttm/{tk}?apikey={api_key}"
-        r = sess.get(url1, timeout=10)
-        if r.ok:
-            arr = r.json()
+        r = sess.get(_TTM_URL.format(tk=tk, k=api_key), timeout=10)
+        if r.status_code == 200:
+            arr = loads(r.content)
             if isinstance(arr, list) and arr:
-                v = _to_float(arr[0].get("bookValuePerShareTTM"))
+                v = to_float(arr[0].get("bookValuePerShareTTM"))
                 if v is not None and v > 0:
                     return float(v)
 
         # Fallback latest key-metrics
-        url2 = f"https://financialmodelingprep.com/api/v3/key-metrics/{tk}?limit=1&apikey={api_key}"
-        r = sess.get(url2, timeout=10)
-        if r.ok:
-            arr = r.json()
+        r = sess.get(_LATEST_URL.format(tk=tk, k=api_key), timeout=10)
+        if r.status_code == 200:
+            arr = loads(r.content)
             if isinstance(arr, list) and arr:
-                v = _to_float(arr[0].get("bookValuePerShare"))
+                v = to_float(arr[0].get("bookValuePerShare"))
                 if v is not None and v > 0:
                     return float(v)
 
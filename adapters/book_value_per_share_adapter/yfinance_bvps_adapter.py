@@ -1,26 +1,12 @@
 from __future__ import annotations
 
-from typing import Any, Optional
-
-import yfinance as yf
-
+from adapters._fast import to_float
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
+from adapters.yf_session import get_ticker
 from adapters.shares_outstanding_adapter.yfinance_shares_outstanding_adapter import (
     YFinanceSharesOutstandingAdapter,
 )
 
-def _to_float(x: Any) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        f = float(x)
-        if f != f:  # NaN
-            return None
-        return f
-    except Exception:
-        return None
-
 
 class YFinanceBVPSAdapter(MetricAdapter):
     """
@@ -42,8 +28,7 @@ class YFinanceBVPSAdapter(MetricAdapter):
     def fetch(self, ticker: str) -> float:
         tk = ticker.upper()
         try:
-            session = get_simple_session()
-            t = yf.Ticker(tk, session=session)
+            t = get_ticker(tk)
 
             # Try quarterly first (fresher), then annual
             for df in (getattr(t, "quarterly_balance_sheet", None), getattr(t, "balance_sheet", None)):
@@ -70,14 +55,14 @@ class YFinanceBVPSAdapter(MetricAdapter):
                     if key in idx_lower:
                         try:
                             v = df.loc[idx_lower[key], col]
-                            equity_val = _to_float(v)
+                            equity_val = to_float(v)
                             if equity_val is not None:
                                 break
                         except Exception:
                             pass
 
                 if equity_val is not None and equity_val != 0:
-                    shares = _to_float(self._so.fetch(tk))
+                    shares = to_float(self._so.fetch(tk))
                     if shares is None or shares <= 0:
                         raise DataNotAvailable(f"{self._name}: shares outstanding missing for {tk}")
                     return float(equity_val / shares)
@@ -1,23 +1,32 @@
 # adapters/current_price_adapter/polygon_current_price_adapter.py
 from __future__ import annotations
 
-import os
-import math
-from typing import Any, Optional
-
-import requests
-
-# Load .env early if python-dotenv is available (non-fatal if missing)
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
+from typing import Any, Dict, Iterable, List, Optional
 
+from adapters._cache import ttl_cache
+from adapters._env import POLYGON_API_KEY
+from adapters._fast import to_positive_float
+from adapters._http import get_async_client, get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
 HTTP_TIMEOUT = 12
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
+SNAPSHOT_URL = "https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/tickers/{tk}"
+BATCH_SNAPSHOT_URL = "https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/tickers"
+BATCH_SIZE = 250  # symbols per multi-ticker snapshot call (keeps the query string short)
+
+
+def _snapshot_price(snap: Any) -> Optional[float]:
+    """Most recent usable price in one ticker snapshot (missing sections -> {})."""
+    if not isinstance(snap, dict):
+        return None
+    lt = snap.get("lastTrade") or {}
+    lq = snap.get("lastQuote") or {}
+    day = snap.get("day") or {}  # today's running close
+    for cand in (lt.get("p"), lt.get("price"), lq.get("p"), lq.get("price"), day.get("c")):
+        price = to_positive_float(cand)
+        if price is not None:
+            return price
+    return None
 
 
 class PolygonCurrentPriceAdapter(MetricAdapter):
@@ -35,66 +44,114 @@ class PolygonCurrentPriceAdapter(MetricAdapter):
         data["ticker"]["lastTrade"]["p"] or ["price"]
         data["ticker"]["lastQuote"]["p"] or ["price"]
         data["ticker"]["day"]["c"] (current day close so far)
+
+    fetch_many() asks the multi-ticker snapshot endpoint (?tickers=A,B,...) for
+    up to BATCH_SIZE symbols per request instead of one request per ticker.
+    fetch_async() awaits the shared httpx.AsyncClient directly (no worker thread).
     """
 
     def __init__(self) -> None:
         self._name = "polygon_current_price"
+        self._api_key = POLYGON_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
-    def _coerce_price(self, val: Optional[Any]) -> Optional[float]:
-        try:
-            if val is None:
-                return None
-            f = float(val)
-            if math.isnan(f) or f <= 0:
-                return None
-            return f
-        except Exception:
-            return None
+    def _parse_snapshot(self, ticker: str, status_code: int, content: bytes) -> float:
+        if status_code != 200:
+            raise DataNotAvailable(f"{self._name}: HTTP {status_code} for {ticker}")
+        data = loads(content)
+        price = _snapshot_price(data.get("ticker") if isinstance(data, dict) else None)
+        if price is None:
+            raise DataNotAvailable(f"{self._name}: no usable price fields for {ticker}")
+        return price
 
+    # Prices move; keep the memo well under the run loop interval
+    @ttl_cache(ttl=60)
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("POLYGON_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing POLYGON_API_KEY")
 
-        url = f"https://api.polygon.io/v2/snapshot/locale/us/markets/stocks/tickers/{ticker.upper()}"
+        url = SNAPSHOT_URL.format(tk=ticker.upper())
         try:
-            resp = requests.get(url, params={"apiKey": api_key}, timeout=HTTP_TIMEOUT, headers=HEADERS)
-            if resp.status_code != 200:
-                raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
-
-            data = resp.json()
-
-            # Try several known locations for a recent price
-            price_candidates = []
-
-            try:
-                price_candidates.append(data["ticker"]["lastTrade"].get("p"))
-                price_candidates.append(data["ticker"]["lastTrade"].get("price"))
-            except Exception:
-                pass
-
-            try:
-                price_candidates.append(data["ticker"]["lastQuote"].get("p"))
-                price_candidates.append(data["ticker"]["lastQuote"].get("price"))
-            except Exception:
-                pass
-
-            try:
-                price_candidates.append(data["ticker"]["day"].get("c"))  # today's running close
-            except Exception:
-                pass
-
-            for cand in price_candidates:
-                price = self._coerce_price(cand)
-                if price is not None:
-                    return price
+            # The shared session already carries the User-Agent header
+            resp = get_session().get(url, params={"apiKey": api_key}, timeout=HTTP_TIMEOUT)
+            return self._parse_snapshot(ticker, resp.status_code, resp.content)
+        except DataNotAvailable:
+            raise
+        except Exception as exc:
+            raise DataNotAvailable(f"{self._name}: failed to fetch price for {ticker}") from exc
 
-            raise DataNotAvailable(f"{self._name}: no usable price fields for {ticker}")
+    async def fetch_async(self, ticker: str) -> float:
+        client = get_async_client()
+        if client is None or not self._api_key:
+            return await super().fetch_async(ticker)
 
+        cache = PolygonCurrentPriceAdapter.fetch.cache  # type: ignore[attr-defined]
+        key = (self._name, ticker.upper())
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+        try:
+            resp = await client.get(
+                SNAPSHOT_URL.format(tk=ticker.upper()),
+                params={"apiKey": self._api_key},
+                timeout=HTTP_TIMEOUT,
+            )
+            price = self._parse_snapshot(ticker, resp.status_code, resp.content)
         except DataNotAvailable:
             raise
         except Exception as exc:
             raise DataNotAvailable(f"{self._name}: failed to fetch price for {ticker}") from exc
+        cache.set(key, price)
+        return price
+
+    def _fetch_batch(self, symbols: List[str]) -> Dict[str, Any]:
+        """One multi-ticker snapshot call -> {SYMBOL: snapshot dict}."""
+        resp = get_session().get(
+            BATCH_SNAPSHOT_URL,
+            params={"tickers": ",".join(symbols), "apiKey": self._api_key},
+            timeout=HTTP_TIMEOUT,
+        )
+        if resp.status_code != 200:
+            raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for batch snapshot")
+        data = loads(resp.content)
+        rows = data.get("tickers") if isinstance(data, dict) else None
+        if not isinstance(rows, list):
+            raise DataNotAvailable(f"{self._name}: unexpected batch snapshot payload")
+        return {str(r.get("ticker", "")).upper(): r for r in rows if isinstance(r, dict)}
+
+    def fetch_many(
+        self, tickers: Iterable[str], concurrency: Optional[int] = None
+    ) -> Dict[str, float | BaseException]:
+        symbols = list(dict.fromkeys(tickers))
+        if not self._api_key or len(symbols) <= 1:
+            return super().fetch_many(symbols, concurrency)
+
+        cache = PolygonCurrentPriceAdapter.fetch.cache  # type: ignore[attr-defined]
+        out: Dict[str, float | BaseException] = {}
+        pending: List[str] = []
+        for tk in symbols:
+            hit = cache.get((self._name, tk.upper()))
+            if hit is None:
+                pending.append(tk)
+            else:
+                out[tk] = hit
+
+        for i in range(0, len(pending), BATCH_SIZE):
+            chunk = pending[i:i + BATCH_SIZE]
+            try:
+                snaps = self._fetch_batch([tk.upper() for tk in chunk])
+            except Exception:
+                # Batch endpoint unavailable (plan limits, outage): per-ticker path
+                out.update(super().fetch_many(chunk, concurrency))
+                continue
+            for tk in chunk:
+                price = _snapshot_price(snaps.get(tk.upper()))
+                if price is None:
+                    out[tk] = DataNotAvailable(f"{self._name}: no usable price fields for {tk}")
+                else:
+                    cache.set((self._name, tk.upper()), price)
+                    out[tk] = price
+        return {tk: out[tk] for tk in symbols}
@@ -1,22 +1,56 @@
 # adapters/current_price_adapter/yfinance_current_price_adapter.py
 from __future__ import annotations
 
-import math
-from typing import Any, Optional
+import asyncio
+import threading
+from typing import Any, Dict, Iterable, List, Optional
 
 import yfinance as yf
 
+from adapters._cache import ttl_cache
+from adapters._fast import to_positive_float
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_rate_limit
 from adapters.yf_session import get_simple_session
 
+BATCH_SIZE = 200  # symbols per yf.download() call
+PRICE_TTL = 60.0  # seconds a fetched price is reused in-process (never persisted)
+# yf.download() collects results in module-level state; one call at a time
+_download_lock = threading.Lock()
+
+
+def _last_closes(df: Any, symbols: List[str]) -> Dict[str, float]:
+    """{SYMBOL: last non-NaN close} from a group_by="ticker" yf.download() frame."""
+    out: Dict[str, float] = {}
+    if df is None or df.empty:
+        return out
+    for sym in symbols:
+        try:
+            close = df[sym]["Close"].dropna()
+        except KeyError:
+            continue
+        if not close.empty:
+            price = to_positive_float(close.iloc[-1])
+            if price is not None:
+                out[sym] = price
+    return out
+
 
 class YFinanceCurrentPriceAdapter(MetricAdapter):
     """
     Gets the latest price using yfinance.
 
     Notes:
-      - Tries fast_info first (very quick), then falls back to 1d history close.
+      - Tries fast_info first (very quick), then falls back to the last close of 5d history.
+      - Builds a fresh yf.Ticker per fetch (on the shared session, so cookie/crumb
+        state is still reused): yfinance caches fast_info on the Ticker, and the
+        memoized get_ticker() objects would serve a stale price for minutes.
       - Returns a float price; raises DataNotAvailable on failure.
+      - fetch_many() pulls the last few daily bars for up to BATCH_SIZE tickers
+        with one yf.download() instead of fast_info's per-ticker 1y history;
+        tickers missing from the download go through fetch(). The async fetch
+        mode (fetch_many_async) uses the same batched path.
+      - Prices are memoized in memory for PRICE_TTL seconds, shared by fetch()
+        and fetch_many(), so repeated runs within a minute skip the network.
     """
 
     def __init__(self) -> None:
@@ -25,22 +59,11 @@ class YFinanceCurrentPriceAdapter(MetricAdapter):
     def get_name(self) -> str:
         return self._name
 
-    def _coerce_price(self, val: Optional[Any]) -> Optional[float]:
-        try:
-            if val is None:
-                return None
-            f = float(val)
-            if math.isnan(f) or f <= 0:
-                return None
-            return f
-        except Exception:
-            return None
-
+    @ttl_cache(ttl=PRICE_TTL)
     @retry_on_rate_limit(max_retries=3, base_delay=5.0)
     def fetch(self, ticker: str) -> float:
         try:
-            session = get_simple_session()
-            t = yf.Ticker(ticker, session=session)
+            t = yf.Ticker(ticker, session=get_simple_session())
 
             # 1) Try fast_info
             price = None
@@ -49,16 +72,19 @@ class YFinanceCurrentPriceAdapter(MetricAdapter):
                 # different yfinance versions expose different keys
                 for key in ("last_price", "lastPrice", "last_trade_price", "lastTradePrice"):
                     val = fi.get(key) if hasattr(fi, "get") else None
-                    price = self._coerce_price(val)
+                    price = to_positive_float(val)
                     if price is not None:
                         return price
 
-            # 2) Fallback: last close from daily history
-            hist = t.history(period="1d", auto_adjust=False)
+            # 2) Fallback: last close from daily history. 5d still has bars over
+            #    weekends/holidays; no adjustment pass or dividend/split columns.
+            hist = t.history(period="5d", auto_adjust=False, prepost=False, actions=False)
             if hist is not None and not hist.empty and "Close" in hist.columns:
-                price = self._coerce_price(hist["Close"].iloc[-1])
-                if price is not None:
-                    return price
+                close = hist["Close"].dropna()
+                if not close.empty:
+                    price = to_positive_float(close.iloc[-1])
+                    if price is not None:
+                        return price
 
             raise DataNotAvailable(f"{self._name}: no usable price for {ticker}")
 
@@ -66,3 +92,57 @@ class YFinanceCurrentPriceAdapter(MetricAdapter):
             raise
         except Exception as exc:
             raise DataNotAvailable(f"{self._name}: failed to fetch price for {ticker}") from exc
+
+    def fetch_many(
+        self, tickers: Iterable[str], concurrency: Optional[int] = None
+    ) -> Dict[str, float | BaseException]:
+        symbols = list(dict.fromkeys(tickers))
+        if len(symbols) <= 1:
+            return super().fetch_many(symbols, concurrency)
+
+        cache = YFinanceCurrentPriceAdapter.fetch.cache  # shared with fetch()
+        out: Dict[str, float | BaseException] = {}
+        pending: List[str] = []
+        for tk in symbols:
+            hit = cache.get((self._name, tk.upper()))
+            if hit is None:
+                pending.append(tk)
+            else:
+                out[tk] = hit
+
+        for i in range(0, len(pending), BATCH_SIZE):
+            chunk = pending[i:i + BATCH_SIZE]
+            upper = [tk.upper() for tk in chunk]
+            try:
+                with _download_lock:
+                    df = yf.download(
+                        upper,
+                        period="5d",  # covers weekends / holidays
+                        interval="1d",
+                        group_by="ticker",
+                        auto_adjust=False,
+                        threads=True,
+                        progress=False,
+                        session=get_simple_session(),
+                    )
+                prices = _last_closes(df, upper)
+            except Exception:
+                prices = {}
+            missing = []
+            for tk, sym in zip(chunk, upper):
+                if sym in prices:
+                    out[tk] = prices[sym]
+                    cache.set((self._name, sym), prices[sym])
+                else:
+                    missing.append(tk)
+            if missing:
+                out.update(super().fetch_many(missing, concurrency))
+        return {tk: out[tk] for tk in symbols}
+
+    async def fetch_many_async(
+        self, tickers: Iterable[str], concurrency: Optional[int] = None
+    ) -> Dict[str, float | BaseException]:
+        # yf.download is blocking; run the batched path off the loop rather
+        # than falling back to one fast_info history per ticker
+        # Default executor, not fetch_pool(): fetch_many() waits on fetch_pool() tasks
+        return await asyncio.to_thread(self.fetch_many, tickers, concurrency)
@@ -1,22 +1,11 @@
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
+from adapters._env import FMP_API_KEY
+from adapters._fast import to_float
+from adapters._http import get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
 
-def _to_float(x: Any) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        f = float(x)
-        if f != f:
-            return None
-        return f
-    except Exception:
-        return None
+DIVIDEND_HISTORY_URL = "https://financialmodelingprep.com/api/v3/historical-price-full/stock_dividend/{tk}"
 
 
 class FMPDividendTTMAdapter(MetricAdapter):
@@ -26,10 +15,14 @@ class FMPDividendTTMAdapter(MetricAdapter):
     Endpoint shape:
       /api/v3/historical-price-full/stock_dividend/{symbol}?apikey=KEY
       Sum the last 4 'dividend' entries as TTM approximation.
+
+    The payload is the full multi-decade history; it is parsed from raw bytes
+    (orjson when available) and only the newest 4 rows are ever touched.
     """
 
     def __init__(self) -> None:
         self._name = "fmp_dividend_ttm"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
@@ -37,27 +30,26 @@ class FMPDividendTTMAdapter(MetricAdapter):
     @retry_on_failure(max_retries=2, delay=0.5)
     def fetch(self, ticker: str) -> float:
         tk = ticker.upper()
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY") or os.getenv("FINANCIAL_PREP_API_KEY".upper())
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: FINANCIAL_PREP_API_KEY missing")
 
-        url = f"https://financialmodelingprep.com/api/v3/historical-price-full/stock_dividend/{tk}?apikey={api_key}"
-        r = requests.get(url, timeout=12)
-        if not r.ok:
+        r = get_session(http2=True).get(DIVIDEND_HISTORY_URL.format(tk=tk), params={"apikey": api_key}, timeout=12)
+        if r.status_code != 200:
             raise DataNotAvailable(f"{self._name}: HTTP {r.status_code} for {tk}")
 
-        js = r.json()
+        js = loads(r.content)
         hist = js.get("historical") if isinstance(js, dict) else None
         if not isinstance(hist, list) or not hist:
             raise DataNotAvailable(f"{self._name}: no dividend history for {tk}")
 
-        # Sum last 4 payments
-        vals = []
+        # Sum last 4 payments (newest first) in one pass
+        total = 0.0
         for row in hist[:4]:
-            v = _to_float(row.get("dividend"))
+            v = to_float(row.get("dividend"))
             if v is not None and v > 0:
-                vals.append(v)
-        if not vals:
+                total += v
+        if total <= 0:
             raise DataNotAvailable(f"{self._name}: zero TTM dividends for {tk}")
 
-        return float(sum(vals))
+        return total
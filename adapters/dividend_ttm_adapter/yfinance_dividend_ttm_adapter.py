@@ -1,22 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Optional
-
-import yfinance as yf
-
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
-
-def _to_float(x: Any) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        f = float(x)
-        if f != f:
-            return None
-        return f
-    except Exception:
-        return None
+from adapters.yf_session import get_ticker
 
 
 class YFinanceDividendTTMAdapter(MetricAdapter):
@@ -35,13 +20,13 @@ class YFinanceDividendTTMAdapter(MetricAdapter):
     def fetch(self, ticker: str) -> float:
         tk = ticker.upper()
         try:
-            session = get_simple_session()
-            t = yf.Ticker(tk, session=session)
+            t = get_ticker(tk)
             s = t.dividends
             if s is None or s.empty:
                 raise DataNotAvailable(f"{self._name}: no dividends series for {tk}")
-            # Sum last ~12 months
-            s = s.sort_index()
+            # Sum last ~12 months (yfinance returns payments oldest-first already)
+            if not s.index.is_monotonic_increasing:
+                s = s.sort_index()
             # If monthly data isn't uniform, take last 4 payments as an approximation to TTM
             ttm = float(s.tail(4).sum())
             if ttm <= 0:
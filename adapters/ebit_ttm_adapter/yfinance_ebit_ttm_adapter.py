@@ -1,25 +1,9 @@
 # adapters/ebit_ttm_adapter/yfinance_ebit_ttm_adapter.py
 from __future__ import annotations
 
-from typing import Any, Optional
-
-import pandas as pd
-import yfinance as yf
-
+from adapters._cache import ttl_cache
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
-
-
-def _f(v: Optional[Any]) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        x = float(v)
-        if x != x:
-            return None
-        return x
-    except Exception:
-        return None
+from adapters.yf_bundle import get_bundle, recent_values
 
 
 class YFinanceEBITTTMAdapter(MetricAdapter):
@@ -27,7 +11,7 @@ class YFinanceEBITTTMAdapter(MetricAdapter):
     Computes EBIT TTM by summing the last 4 quarterly EBIT values via yfinance.
 
     Strategy:
-      - Use t.quarterly_financials DataFrame.
+      - Use the shared quarterly income statement (adapters.yf_bundle).
       - Prefer rows labeled 'EBIT' or 'Ebit'; fallback to 'Operating Income'.
       - Sum up to 4 most recent non-null values.
     """
@@ -38,52 +22,29 @@ class YFinanceEBITTTMAdapter(MetricAdapter):
     def get_name(self) -> str:
         return self._name
 
+    @ttl_cache(ttl=300)
     @retry_on_failure(max_retries=3, delay=0.5)
     def fetch(self, ticker: str) -> float:
         try:
-            session = get_simple_session()
-            t = yf.Ticker(ticker, session=session)
-            df: Optional[pd.DataFrame] = None
-
+            b = get_bundle(ticker)
             try:
-                df = t.quarterly_financials  # type: ignore[attr-defined]
+                df = b.statement("income")
             except Exception:
                 df = None
 
-            if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+            if df is None:
                 raise DataNotAvailable(f"{self._name}: quarterly financials unavailable for {ticker}")
 
-            row_candidates = ["EBIT", "Ebit", "Operating Income", "OperatingIncome"]
-            row = None
-            for lbl in row_candidates:
-                if lbl in df.index:
-                    row = df.loc[lbl]
-                    break
+            # Bundle columns are already most-recent-first; labels compare normalized
+            row = b.row("income", ("EBIT", "Operating Income"))
             if row is None or row.empty:
                 raise DataNotAvailable(f"{self._name}: EBIT/Operating Income row not found for {ticker}")
 
-            s = row.dropna()
-            if s.empty:
-                raise DataNotAvailable(f"{self._name}: EBIT series empty for {ticker}")
-
-            # Sort columns descending by label if possible (recent first)
-            try:
-                s = s.sort_index(ascending=False)
-            except Exception:
-                pass
-
-            vals = []
-            for v in s.tolist():
-                cv = _f(v)
-                if cv is not None:
-                    vals.append(cv)
-                if len(vals) == 4:
-                    break
-
-            if not vals:
+            vals = recent_values(row, 4)
+            if vals.size == 0:
                 raise DataNotAvailable(f"{self._name}: no usable EBIT values for {ticker}")
 
-            return float(sum(vals))
+            return float(vals.sum())
 
         except DataNotAvailable:
             raise
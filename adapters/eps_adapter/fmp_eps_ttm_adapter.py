@@ -1,15 +1,16 @@
 # adapters/eps_adapter/fmp_eps_ttm_adapter.py
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
+from adapters._env import FMP_API_KEY
+from adapters._fast import pick
+from adapters._http import get_async_client, get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
 HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
+KEY_METRICS_TTM_URL = "https://financialmodelingprep.com/api/v3/key-metrics-ttm/{tk}"
+
+# Schema variations seen across FMP API versions
+_EPS_TTM_KEYS = ("epsTTM", "eps_ttm", "epsTtm", "epsTrailingTwelveMonths")
 
 
 class FMPEPSTTMAdapter(MetricAdapter):
@@ -25,51 +26,51 @@ class FMPEPSTTMAdapter(MetricAdapter):
 
     def __init__(self) -> None:
         self._name = "fmp_eps_ttm"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
-    def _coerce(self, v: Optional[Any]) -> Optional[float]:
-        try:
-            if v is None:
-                return None
-            f = float(v)
-            if f != f:  # NaN
-                return None
-            return f
-        except Exception:
-            return None
+    def _parse(self, ticker: str, status_code: int, content: bytes) -> float:
+        if status_code != 200:
+            raise DataNotAvailable(f"{self._name}: HTTP {status_code} for {ticker}")
+
+        data = loads(content)
+        # FMP returns a list; usually the first element has fields we need
+        if not isinstance(data, list) or not data:
+            raise DataNotAvailable(f"{self._name}: unexpected payload shape")
+
+        val = pick(data[0], _EPS_TTM_KEYS)
+        if val is not None:
+            return val
+
+        raise DataNotAvailable(f"{self._name}: eps TTM not found for {ticker}")
 
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing FINANCIAL_PREP_API_KEY")
 
-        url = f"https://financialmodelingprep.com/api/v3/key-metrics-ttm/{ticker.upper()}"
         try:
-            resp = requests.get(url, params={"apikey": api_key}, timeout=HTTP_TIMEOUT, headers=HEADERS)
-            if resp.status_code != 200:
-                raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
-
-            data = resp.json()
-            # FMP returns a list; usually the first element has fields we need
-            if not isinstance(data, list) or not data:
-                raise DataNotAvailable(f"{self._name}: unexpected payload shape")
-
-            row = data[0]
-            candidates = [
-                row.get("epsTTM"),
-                row.get("eps_ttm"),
-                row.get("epsTtm"),
-                row.get("epsTrailingTwelveMonths"),
-            ]
-            for c in candidates:
-                val = self._coerce(c)
-                if val is not None:
-                    return val
-
-            raise DataNotAvailable(f"{self._name}: eps TTM not found for {ticker}")
+            resp = get_session(http2=True).get(
+                KEY_METRICS_TTM_URL.format(tk=ticker.upper()), params={"apikey": api_key}, timeout=HTTP_TIMEOUT
+            )
+            return self._parse(ticker, resp.status_code, resp.content)
+        except DataNotAvailable:
+            raise
+        except Exception as exc:
+            raise DataNotAvailable(f"{self._name}: failed to fetch EPS TTM for {ticker}") from exc
+
+    async def fetch_async(self, ticker: str) -> float:
+        client = get_async_client()
+        if client is None or not self._api_key:
+            return await super().fetch_async(ticker)
 
+        try:
+            resp = await client.get(
+                KEY_METRICS_TTM_URL.format(tk=ticker.upper()), params={"apikey": self._api_key}, timeout=HTTP_TIMEOUT
+            )
+            return self._parse(ticker, resp.status_code, resp.content)
         except DataNotAvailable:
             raise
         except Exception as exc:
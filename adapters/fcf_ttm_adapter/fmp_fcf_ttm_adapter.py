@@ -1,34 +1,13 @@
 # adapters/fcf_ttm_adapter/fmp_fcf_ttm_adapter.py
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
-# Load .env early if python-dotenv is available (non-fatal if missing)
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
-
+from adapters._env import FMP_API_KEY
+from adapters._fast import to_float
+from adapters._http import get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
 HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
-
-
-def _f(v: Optional[Any]) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        x = float(v)
-        if x != x:  # NaN
-            return None
-        return x
-    except Exception:
-        return None
+CASH_FLOW_STATEMENT_URL = "https://financialmodelingprep.com/api/v3/cash-flow-statement/{tk}"
 
 
 class FMPFCFTTMAdapter(MetricAdapter):
@@ -49,37 +28,37 @@ class FMPFCFTTMAdapter(MetricAdapter):
 
     def __init__(self) -> None:
         self._name = "fmp_fcf_ttm"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing FINANCIAL_PREP_API_KEY")
 
-        url = f"https://financialmodelingprep.com/api/v3/cash-flow-statement/{ticker.upper()}"
+        url = CASH_FLOW_STATEMENT_URL.format(tk=ticker.upper())
         try:
-            resp = requests.get(
+            resp = get_session(http2=True).get(
                 url,
                 params={"period": "quarter", "limit": 4, "apikey": api_key},
                 timeout=HTTP_TIMEOUT,
-                headers=HEADERS,
             )
             if resp.status_code != 200:
                 raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
 
-            data = resp.json()
+            data = loads(resp.content)
             if not isinstance(data, list) or not data:
                 raise DataNotAvailable(f"{self._name}: unexpected payload shape")
 
             total = 0.0
             count = 0
             for row in data:
-                fcf = _f(row.get("freeCashFlow"))
+                fcf = to_float(row.get("freeCashFlow"))
                 if fcf is None:
-                    ocf = _f(row.get("operatingCashFlow"))
-                    capex = _f(row.get("capitalExpenditure"))
+                    ocf = to_float(row.get("operatingCashFlow"))
+                    capex = to_float(row.get("capitalExpenditure"))
                     if ocf is not None and capex is not None:
                         fcf = ocf - capex
                 if fcf is not None:
@@ -1,34 +1,15 @@
 # adapters/growth_adapter/fmp_eps_cagr5_adapter.py
 from __future__ import annotations
 
-import os
-from typing import Any, List, Optional, Tuple
-
-import requests
-
-# Load .env early if python-dotenv is available (non-fatal if missing)
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
+from typing import List, Optional
 
+from adapters._cache import disk_cache
+from adapters._env import FMP_API_KEY
+from adapters._fast import pick
+from adapters._fmp import income_statement
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
-HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
-
-
-def _coerce_float(v: Any) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        f = float(v)
-        if f != f:  # NaN
-            return None
-        return f
-    except Exception:
-        return None
+_EPS_KEYS = ("epsdiluted", "epsDiluted", "eps", "EPS")
 
 
 def _compute_cagr(earliest: float, latest: float, years: float) -> Optional[float]:
@@ -69,65 +50,43 @@ class FMPEPSCAGR5Adapter(MetricAdapter):
 
     def __init__(self) -> None:
         self._name = "fmp_eps_cagr_5y"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
+    # Annual statements: a week-old answer is as good as a fresh one
+    @disk_cache(ttl=7 * 86400)
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing FINANCIAL_PREP_API_KEY")
 
-        url = f"https://financialmodelingprep.com/api/v3/income-statement/{ticker.upper()}"
         try:
-            resp = requests.get(
-                url,
-                params={"period": "annual", "limit": 10, "apikey": api_key},
-                timeout=HTTP_TIMEOUT,
-                headers=HEADERS,
-            )
-            if resp.status_code != 200:
-                raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
-
-            data = resp.json()
+            status, data = income_statement(ticker, api_key, period="annual", limit=10)
+            if status != 200:
+                raise DataNotAvailable(f"{self._name}: HTTP {status} for {ticker}")
+
             if not isinstance(data, list) or not data:
                 raise DataNotAvailable(f"{self._name}: unexpected payload shape")
 
-            # FMP returns most-recent first. Build list of (year_str, eps_value)
-            points: List[Tuple[str, float]] = []
+            # FMP returns most-recent first; only the newest value and the one
+            # ~5 years back are used, so stop after 6 usable EPS points
+            eps_points: List[float] = []
             for row in data:
-                # Try several field names for EPS
-                eps_candidates = [
-                    row.get("epsdiluted"),
-                    row.get("epsDiluted"),
-                    row.get("eps"),
-                    row.get("EPS"),
-                ]
-                eps = None
-                for c in eps_candidates:
-                    eps = _coerce_float(c)
-                    if eps is not None:
+                eps = pick(row, _EPS_KEYS)
+                if eps is not None:
+                    eps_points.append(eps)
+                    if len(eps_points) == 6:
                         break
-                if eps is None:
-                    continue
 
-                year = row.get("calendarYear") or row.get("date") or ""
-                year = str(year)
-                points.append((year, eps))
-
-            if len(points) < 2:
+            if len(eps_points) < 2:
                 raise DataNotAvailable(f"{self._name}: insufficient EPS history for {ticker}")
 
-            # Points are most-recent first; reverse to chronological
-            points = list(reversed(points))
-
-            # Choose earliest and latest ~5 years apart (fallback to max span if fewer)
-            earliest_idx = max(0, len(points) - 6)  # ~5 intervals back
-            latest_idx = len(points) - 1
-
-            earliest_eps = points[earliest_idx][1]
-            latest_eps = points[latest_idx][1]
-            years_span = max(1.0, latest_idx - earliest_idx)  # assume 1 year per step
+            span = len(eps_points) - 1  # assume 1 year per step
+            latest_eps = eps_points[0]
+            earliest_eps = eps_points[span]
+            years_span = float(span)
 
             cagr = _compute_cagr(earliest_eps, latest_eps, years_span)
             if cagr is None:
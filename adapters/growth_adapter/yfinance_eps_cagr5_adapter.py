@@ -5,28 +5,36 @@ from typing import Optional, Tuple
 
 import numpy as np
 import pandas as pd
-import yfinance as yf
 
+from adapters._cache import disk_cache
+from adapters._fast import to_float
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
+from adapters.yf_bundle import YFBundle, get_bundle
 
 
 # ---------------------------- helpers ----------------------------
 
-def _f(x) -> Optional[float]:
-    try:
-        if x is None:
-            return None
-        v = float(x)
-        if np.isnan(v):  # NaN
-            return None
-        return v
-    except Exception:
-        return None
-
-
-def _norm(s: str) -> str:
-    return "".join(ch for ch in str(s).lower() if ch.isalnum())
+# Candidate statement rows (compared normalized, see yf_bundle.normalize_label), in priority order
+_EPS_LABELS = (
+    "dilutedeps", "epsdiluted", "basiceps", "epsbasic", "eps",
+    "earningspersharediluted", "earningspersharebasic",
+)
+# Quarterly diluted EPS only, as in the EPS TTM adapter
+_QUARTERLY_EPS_LABELS = ("dilutedeps", "epsdiluted", "earningspersharediluted")
+_NET_INCOME_LABELS = (
+    "netincomecommonstockholders",
+    "netincomeapplicabletocommon",
+    "netincome",
+    "netincomefromcontinuingoperations",
+)
+_SHARES_LABELS = (
+    "weightedaveragesharesdiluted",
+    "dilutedaverageshares",
+    "averagesharesdiluted",
+    "weightedaveragesharesbasic",
+    "basicaverageshares",
+    "averagesharesbasic",
+)
 
 
 def _series_to_float_by_date(ser: pd.Series) -> Optional[pd.Series]:
@@ -52,9 +60,9 @@ def _series_to_float_by_date(ser: pd.Series) -> Optional[pd.Series]:
     ser = ser.iloc[order]
     dates_sorted = pd.DatetimeIndex(dates.values[order], name="date")
 
-    # coerce to float & drop NaN/inf
-    ser = ser.apply(_f)
-    ser = pd.to_numeric(ser, errors="coerce").replace([np.inf, -np.inf], np.nan).dropna()
+    # coerce to float & drop NaN/inf in one vectorized pass
+    ser = pd.to_numeric(ser, errors="coerce").astype("float64")
+    ser = ser[np.isfinite(ser.to_numpy())]
     if ser.empty:
         return None
 
@@ -73,54 +81,20 @@ def _series_to_float_by_date(ser: pd.Series) -> Optional[pd.Series]:
     return ser if not ser.empty else None
 
 
-def _extract_eps_series(df: pd.DataFrame) -> Optional[pd.Series]:
+def _extract_eps_series(b: YFBundle) -> Optional[pd.Series]:
     """
     Try direct EPS rows (prioritizing diluted EPS); else compute EPS = Net Income / Weighted Avg Diluted Shares.
     Returns Series indexed by period-end (datetime64[ns]) with float EPS.
     """
-    if df is None or df.empty:
-        return None
-
-    idx_map = {_norm(ix): ix for ix in df.index}
-    # Common EPS label variants
-    eps_keys = [
-        "dilutedeps", "epsdiluted", "basiceps", "epsbasic", "eps",
-        "earningspersharediluted", "earningspersharebasic"
-    ]
-    for key in eps_keys:
-        if key in idx_map:
-            ser = df.loc[idx_map[key]]
-            return _series_to_float_by_date(ser)
+    eps_row = b.row("income", _EPS_LABELS, freq="yearly")
+    if eps_row is not None:
+        return _series_to_float_by_date(eps_row)
 
     # Compute EPS = Net Income (to common) / Weighted Avg Shares (prioritizing diluted)
-    ni_keys = [
-        "netincomecommonstockholders",
-        "netincomeapplicabletocommon",
-        "netincome",
-        "netincomefromcontinuingoperations",
-    ]
-    sh_keys = [
-        "weightedaveragesharesdiluted",
-        "dilutedaverageshares",
-        "averagesharesdiluted",
-        "weightedaveragesharesbasic",
-        "basicaverageshares",
-        "averagesharesbasic",
-    ]
-
-    ni = None
-    for k in ni_keys:
-        if k in idx_map:
-            ni = df.loc[idx_map[k]]
-            break
+    ni = b.row("income", _NET_INCOME_LABELS, freq="yearly")
     if ni is None:
         return None
-
-    sh = None
-    for k in sh_keys:
-        if k in idx_map:
-            sh = df.loc[idx_map[k]]
-            break
+    sh = b.row("income", _SHARES_LABELS, freq="yearly")
     if sh is None:
         return None
 
@@ -206,6 +180,7 @@ def _cagr_pos(earliest: float, latest: float, years: float) -> Optional[float]:
 
 # ---------------------------- adapter ----------------------------
 
+
 class YFinanceEPSCAGR5Adapter(MetricAdapter):
     """
     ~5Y EPS CAGR (annual GAAP) from yfinance income statements.
@@ -223,65 +198,57 @@ class YFinanceEPSCAGR5Adapter(MetricAdapter):
     def get_name(self) -> str:
         return self._name
 
-    def _get_current_ttm_eps(self, t: yf.Ticker) -> Optional[float]:
-        """Get the most recent TTM EPS from yfinance info."""
+    def _get_current_ttm_eps(self, b: YFBundle) -> Optional[float]:
+        """
+        Most recent TTM EPS, cheapest source first: trailingEps from the narrow
+        defaultKeyStatistics module, then the last 4 quarterly diluted EPS from
+        the shared statement. The full .info scrape (Yahoo's most throttled
+        endpoint) is only a last resort.
+        """
         try:
-            info = t.info  # type: ignore[attr-defined]
-            
-            if not isinstance(info, dict):
-                return None
+            val = to_float(b.quote_module("defaultKeyStatistics").get("trailingEps"))
+            if val is not None:
+                return val
+        except Exception:
+            pass
 
-            # Try to get trailing EPS directly
-            trailing_eps = info.get('trailingEps')
-            if trailing_eps is not None:
-                val = _f(trailing_eps)
-                if val is not None:
-                    return float(val)
-            
-            # Try alternative field names
-            eps_trailing = info.get('epsTrailingTwelveMonths')
-            if eps_trailing is not None:
-                val = _f(eps_trailing)
+        try:
+            vals = b.values("income", _QUARTERLY_EPS_LABELS)
+            if vals is not None and vals.size >= 4:
+                return float(vals[:4].sum())
+        except Exception:
+            pass
+
+        try:
+            info = b.info()
+            for key in ("trailingEps", "epsTrailingTwelveMonths"):
+                val = to_float(info.get(key))
                 if val is not None:
-                    return float(val)
-            
+                    return val
             return None
         except Exception:
             return None
 
+    @disk_cache(ttl=7 * 86400)
     @retry_on_failure(max_retries=3, delay=0.6)
     def fetch(self, ticker: str) -> float:
         tk = ticker.upper()
-        t = yf.Ticker(tk, session=get_simple_session())
+        b = get_bundle(tk)
 
-        # Get historical annual EPS data
-        df: Optional[pd.DataFrame] = None
-        # Preferred API
+        # Historical annual EPS data (income_stmt / financials are the same frame)
         try:
-            df = t.get_income_stmt(freq="yearly", pretty=True)  # type: ignore[attr-defined]
+            df = b.statement("income", freq="yearly")
         except Exception:
             df = None
-        # Fallbacks
-        if df is None or df.empty:
-            try:
-                df = t.income_stmt  # type: ignore[attr-defined]
-            except Exception:
-                df = None
-        if df is None or df.empty:
-            try:
-                df = t.financials  # type: ignore[attr-defined]
-            except Exception:
-                df = None
-
-        if df is None or df.empty:
+        if df is None:
             raise DataNotAvailable(f"{self._name}: income statement unavailable for {tk}")
 
-        eps = _extract_eps_series(df)
+        eps = _extract_eps_series(b)
         if eps is None or eps.size < 1:
             raise DataNotAvailable(f"{self._name}: EPS series not usable for {tk}")
 
         # Try to get the current TTM EPS and replace the most recent annual value
-        current_ttm_eps = self._get_current_ttm_eps(t)
+        current_ttm_eps = self._get_current_ttm_eps(b)
         if current_ttm_eps is not None and current_ttm_eps > 0:
             # Replace the most recent annual EPS with TTM EPS
             import pandas as pd
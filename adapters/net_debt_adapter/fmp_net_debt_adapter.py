@@ -1,34 +1,13 @@
 # adapters/net_debt_adapter/fmp_net_debt_adapter.py
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
-# Load .env early if python-dotenv is available (non-fatal if missing)
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
-
+from adapters._env import FMP_API_KEY
+from adapters._fast import to_float
+from adapters._http import get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
 HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
-
-
-def _f(v: Optional[Any]) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        x = float(v)
-        if x != x:  # NaN
-            return None
-        return x
-    except Exception:
-        return None
+BALANCE_SHEET_URL = "https://financialmodelingprep.com/api/v3/balance-sheet-statement/{tk}"
 
 
 class FMPNetDebtAdapter(MetricAdapter):
@@ -49,49 +28,49 @@ class FMPNetDebtAdapter(MetricAdapter):
 
     def __init__(self) -> None:
         self._name = "fmp_net_debt"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing FINANCIAL_PREP_API_KEY")
 
-        url = f"https://financialmodelingprep.com/api/v3/balance-sheet-statement/{ticker.upper()}"
+        url = BALANCE_SHEET_URL.format(tk=ticker.upper())
         try:
-            resp = requests.get(
+            resp = get_session(http2=True).get(
                 url,
                 params={"period": "quarter", "limit": 1, "apikey": api_key},
                 timeout=HTTP_TIMEOUT,
-                headers=HEADERS,
             )
             if resp.status_code != 200:
                 raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
 
-            data = resp.json()
+            data = loads(resp.content)
             if not isinstance(data, list) or not data:
                 raise DataNotAvailable(f"{self._name}: unexpected payload shape")
 
             row = data[0]
 
             # 1) direct field
-            nd = _f(row.get("netDebt"))
+            nd = to_float(row.get("netDebt"))
             if nd is not None:
                 return nd
 
             # 2) compute from components
-            total_debt = _f(row.get("totalDebt")) or _f(row.get("shortTermDebt")) or 0.0
+            total_debt = to_float(row.get("totalDebt")) or to_float(row.get("shortTermDebt")) or 0.0
             if total_debt and (row.get("longTermDebt") is not None):
-                ltd = _f(row.get("longTermDebt"))
+                ltd = to_float(row.get("longTermDebt"))
                 if ltd is not None and total_debt < ltd:
                     # Some payloads don't set totalDebt, combine if needed
-                    std = _f(row.get("shortTermDebt")) or 0.0
+                    std = to_float(row.get("shortTermDebt")) or 0.0
                     total_debt = ltd + std
 
             cash_sti = (
-                _f(row.get("cashAndShortTermInvestments"))
-                or _f(row.get("cashAndCashEquivalents"))
+                to_float(row.get("cashAndShortTermInvestments"))
+                or to_float(row.get("cashAndCashEquivalents"))
                 or 0.0
             )
 
@@ -1,25 +1,14 @@
 # adapters/net_debt_adapter/yfinance_net_debt_adapter.py
 from __future__ import annotations
 
-from typing import Optional, Any
+from typing import Optional
 
 import pandas as pd
 import yfinance as yf
 
+from adapters._fast import to_float
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure, retry_on_rate_limit
-from adapters.yf_session import get_simple_session
-
-
-def _f(v: Optional[Any]) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        x = float(v)
-        if x != x:  # NaN
-            return None
-        return x
-    except Exception:
-        return None
+from adapters.yf_bundle import YFBundle, get_bundle
 
 
 class YFinanceNetDebtAdapter(MetricAdapter):
@@ -41,10 +30,10 @@ class YFinanceNetDebtAdapter(MetricAdapter):
     def get_name(self) -> str:
         return self._name
 
-    def _get_net_debt_from_info(self, t: yf.Ticker) -> Optional[float]:
+    def _get_net_debt_from_info(self, b: YFBundle) -> Optional[float]:
         """Try to get net debt from info fields as fallback."""
         try:
-            info = t.info  # type: ignore[attr-defined]
+            info = b.info()
             
             if not isinstance(info, dict):
                 return None
@@ -53,7 +42,7 @@ class YFinanceNetDebtAdapter(MetricAdapter):
             total_debt = None
             for debt_field in ['totalDebt', 'totalDebtToEquity', 'debtToEquity']:
                 if debt_field in info:
-                    debt_val = _f(info[debt_field])
+                    debt_val = to_float(info[debt_field])
                     if debt_val is not None:
                         if debt_field == 'totalDebt':
                             total_debt = debt_val
@@ -67,7 +56,7 @@ class YFinanceNetDebtAdapter(MetricAdapter):
             cash = None
             for cash_field in ['totalCash', 'cash', 'cashAndCashEquivalents']:
                 if cash_field in info:
-                    cash_val = _f(info[cash_field])
+                    cash_val = to_float(info[cash_field])
                     if cash_val is not None:
                         cash = cash_val
                         break
@@ -87,7 +76,7 @@ class YFinanceNetDebtAdapter(MetricAdapter):
             
             for debt_field in debt_indicators:
                 if debt_field in info:
-                    debt_val = _f(info[debt_field])
+                    debt_val = to_float(info[debt_field])
                     if debt_val is not None:
                         total_debt_alt += debt_val
 
@@ -97,7 +86,7 @@ class YFinanceNetDebtAdapter(MetricAdapter):
             
             for cash_field in cash_indicators:
                 if cash_field in info:
-                    cash_val = _f(info[cash_field])
+                    cash_val = to_float(info[cash_field])
                     if cash_val is not None:
                         cash_alt = cash_val
                         break
@@ -122,24 +111,13 @@ class YFinanceNetDebtAdapter(MetricAdapter):
             if df is None or not isinstance(df, pd.DataFrame) or df.empty:
                 raise DataNotAvailable(f"{self._name}: quarterly balance sheet unavailable")
 
-            # Get most recent column
-            col = None
-            try:
-                # Columns are dates; take the last non-null column after sorting
-                ordered_cols = list(df.columns)
-                if not ordered_cols:
-                    raise KeyError
-                col = ordered_cols[0] if len(ordered_cols) == 1 else ordered_cols[-1]
-            except Exception:
-                # Fallback: take any column that exists
-                if df.columns.size == 0:
-                    raise DataNotAvailable(f"{self._name}: no columns in balance sheet")
-                col = df.columns[-1]
+            # Columns are dates; take the last one (a non-empty frame has at least one)
+            col = df.columns[-1]
 
             def row_val(*labels: str) -> Optional[float]:
                 for lbl in labels:
                     if lbl in df.index and col in df.columns:
-                        v = _f(df.at[lbl, col])
+                        v = to_float(df.at[lbl, col])
                         if v is not None:
                             return v
                 return None
@@ -181,15 +159,14 @@ class YFinanceNetDebtAdapter(MetricAdapter):
     @retry_on_rate_limit(max_retries=3, base_delay=5.0)
     def fetch(self, ticker: str) -> float:
         try:
-            session = get_simple_session()
-            t = yf.Ticker(ticker, session=session)
+            b = get_bundle(ticker)
             
             # First try: Get from balance sheet
             try:
-                return self._get_net_debt_from_balance_sheet(t)
+                return self._get_net_debt_from_balance_sheet(b.ticker)
             except DataNotAvailable as e:
                 # If balance sheet fails, try info fields as fallback
-                net_debt_from_info = self._get_net_debt_from_info(t)
+                net_debt_from_info = self._get_net_debt_from_info(b)
                 if net_debt_from_info is not None:
                     return net_debt_from_info
                 else:
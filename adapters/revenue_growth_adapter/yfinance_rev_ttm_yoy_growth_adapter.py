@@ -1,13 +1,11 @@
 # adapters/revenue_growth_adapter/yfinance_rev_ttm_yoy_growth_adapter.py
 from __future__ import annotations
 
-from typing import Optional
-
-import pandas as pd
-import yfinance as yf
-
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
+from adapters.yf_bundle import get_bundle
+
+# Revenue row spellings across yfinance versions (compared normalized)
+_REVENUE_LABELS = ("Total Revenue", "Revenue", "Sales")
 
 
 class YFinanceRevTTMYoYGrowthAdapter(MetricAdapter):
@@ -30,49 +28,26 @@ class YFinanceRevTTMYoYGrowthAdapter(MetricAdapter):
 
     @retry_on_failure(max_retries=3, delay=0.6)
     def fetch(self, ticker: str) -> float:
-        t = yf.Ticker(ticker.upper(), session=get_simple_session())
+        b = get_bundle(ticker)
 
-        # Prefer modern getter
-        qdf: Optional[pd.DataFrame] = None
+        # Shared quarterly income statement (same frame as t.quarterly_income_stmt)
         try:
-            qdf = t.get_income_stmt(freq="quarterly", pretty=True)
+            qdf = b.statement("income")
         except Exception:
             qdf = None
 
-        if qdf is None or qdf.empty:
-            # Fallback to legacy property
-            try:
-                qdf = t.quarterly_income_stmt  # type: ignore[attr-defined]
-            except Exception:
-                qdf = None
-
-        if qdf is None or qdf.empty:
+        if qdf is None:
             raise DataNotAvailable(f"{self._name}: quarterly income statement unavailable for {ticker}")
 
-        idx = {str(i).strip().lower(): i for i in qdf.index}
-        rev_key = None
-        for key in ("total revenue", "revenue", "sales", "totalrevenue"):
-            if key in idx:
-                rev_key = idx[key]
-                break
-        if rev_key is None:
+        # Revenue row as coerced once per bundle, newest quarter first
+        vals = b.values("income", _REVENUE_LABELS)
+        if vals is None:
             raise DataNotAvailable(f"{self._name}: Total Revenue row not found for {ticker}")
-
-        ser = qdf.loc[rev_key]
-        vals = pd.to_numeric(ser, errors="coerce").dropna()
-        if len(vals) < 8:
+        if vals.size < 8:
             raise DataNotAvailable(f"{self._name}: need >= 8 quarterly revenue points for {ticker}")
 
-        # ensure chronological ascending by index if possible
-        try:
-            dates = pd.to_datetime(vals.index, errors="coerce")
-            order = dates.argsort()
-            vals = vals.iloc[order]
-        except Exception:
-            vals = vals[::-1]  # best guess fallback
-
-        ttm_curr = float(vals.tail(4).sum())
-        ttm_prev = float(vals.tail(8).head(4).sum())
+        ttm_curr = float(vals[:4].sum())
+        ttm_prev = float(vals[4:8].sum())
         if ttm_prev <= 0:
             raise DataNotAvailable(f"{self._name}: prior TTM revenue <= 0 for {ticker}")
 
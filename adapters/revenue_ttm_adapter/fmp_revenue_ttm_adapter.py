@@ -1,34 +1,13 @@
 # adapters/revenue_ttm_adapter/fmp_revenue_ttm_adapter.py
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
-# Load .env early if python-dotenv is available (non-fatal if missing)
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
-
+from adapters._cache import disk_cache
+from adapters._env import FMP_API_KEY
+from adapters._fast import pick
+from adapters._fmp import income_statement
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
-HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
-
-
-def _coerce(v: Optional[Any]) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        f = float(v)
-        if f != f:  # NaN
-            return None
-        return f
-    except Exception:
-        return None
+_REVENUE_KEYS = ("revenue", "Revenue")
 
 
 class FMPRevenueTTMAdapter(MetricAdapter):
@@ -44,34 +23,30 @@ class FMPRevenueTTMAdapter(MetricAdapter):
 
     def __init__(self) -> None:
         self._name = "fmp_revenue_ttm"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
+    @disk_cache(ttl=7 * 86400)
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing FINANCIAL_PREP_API_KEY")
 
-        url = f"https://financialmodelingprep.com/api/v3/income-statement/{ticker.upper()}"
         try:
-            resp = requests.get(
-                url,
-                params={"period": "quarter", "limit": 4, "apikey": api_key},
-                timeout=HTTP_TIMEOUT,
-                headers=HEADERS,
-            )
-            if resp.status_code != 200:
-                raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
+            # Shared with the other income-statement adapters (one request per ticker)
+            status, data = income_statement(ticker, api_key, period="quarter", limit=4)
+            if status != 200:
+                raise DataNotAvailable(f"{self._name}: HTTP {status} for {ticker}")
 
-            data = resp.json()
             if not isinstance(data, list) or not data:
                 raise DataNotAvailable(f"{self._name}: unexpected payload shape")
 
             total = 0.0
             count = 0
             for row in data:
-                val = _coerce(row.get("revenue") or row.get("Revenue"))
+                val = pick(row, _REVENUE_KEYS)
                 if val is not None:
                     total += val
                     count += 1
@@ -1,25 +1,12 @@
 # adapters/revenue_ttm_adapter/yfinance_revenue_ttm_adapter.py
 from __future__ import annotations
 
-from typing import Any, Optional
-
-import pandas as pd
-import yfinance as yf
-
+from adapters._cache import disk_cache
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
+from adapters.yf_bundle import get_bundle
 
-
-def _coerce(v: Optional[Any]) -> Optional[float]:
-    try:
-        if v is None:
-            return None
-        f = float(v)
-        if f != f:
-            return None
-        return f
-    except Exception:
-        return None
+# Revenue row spellings across yfinance versions (compared normalized)
+_REVENUE_LABELS = ("Total Revenue", "Revenue")
 
 
 class YFinanceRevenueTTMAdapter(MetricAdapter):
@@ -40,53 +27,25 @@ class YFinanceRevenueTTMAdapter(MetricAdapter):
     def get_name(self) -> str:
         return self._name
 
+    @disk_cache(ttl=7 * 86400)
     @retry_on_failure(max_retries=3, delay=0.5)
     def fetch(self, ticker: str) -> float:
         try:
-            session = get_simple_session()
-            t = yf.Ticker(ticker, session=session)
-            df: Optional[pd.DataFrame] = None
-
-            try:
-                df = t.quarterly_financials  # type: ignore[attr-defined]
-            except Exception:
-                df = None
-
-            if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+            b = get_bundle(ticker)
+            # Shared quarterly income statement (same frame as t.quarterly_financials)
+            if b.statement("income") is None:
                 raise DataNotAvailable(f"{self._name}: quarterly financials unavailable for {ticker}")
 
-            row_candidates = ["Total Revenue", "TotalRevenue", "Revenue", "totalRevenue"]
-            row = None
-            for lbl in row_candidates:
-                if lbl in df.index:
-                    row = df.loc[lbl]
-                    break
-            if row is None or row.empty:
+            vals = b.values("income", _REVENUE_LABELS)
+            if vals is None:
                 raise DataNotAvailable(f"{self._name}: revenue row not found for {ticker}")
 
-            s = row.dropna()
-            if s.empty:
-                raise DataNotAvailable(f"{self._name}: revenue series empty for {ticker}")
-
-            # Sort columns descending by label if possible (recent first)
-            try:
-                s = s.sort_index(ascending=False)
-            except Exception:
-                pass
-
-            # Take up to 4 most recent values
-            vals = []
-            for v in s.tolist():
-                cv = _coerce(v)
-                if cv is not None:
-                    vals.append(cv)
-                if len(vals) == 4:
-                    break
-
-            if not vals:
+            # Up to 4 most recent numeric values (bundle columns are newest-first)
+            vals = vals[:4]
+            if vals.size == 0:
                 raise DataNotAvailable(f"{self._name}: no usable revenue values for {ticker}")
 
-            return float(sum(vals))
+            return float(vals.sum())
 
         except DataNotAvailable:
             raise
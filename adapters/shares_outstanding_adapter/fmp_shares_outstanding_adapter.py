@@ -1,22 +1,26 @@
 # adapters/shares_outstanding_adapter/fmp_shares_outstanding_adapter.py
 from __future__ import annotations
 
-import os
-from typing import Any, Optional
-
-import requests
-
-# Load .env early if python-dotenv is available (non-fatal if missing)
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
+from typing import Any, Dict, Iterable, List, Optional
 
+from adapters._cache import disk_cache, disk_lookup, disk_store
+from adapters._env import FMP_API_KEY
+from adapters._fast import to_positive_float
+from adapters._http import get_async_client, get_session, loads
 from adapters.adapter import MetricAdapter, DataNotAvailable
 
 HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
+PROFILE_URL = "https://financialmodelingprep.com/api/v3/profile/{tk}"
+PROFILE_BATCH_SIZE = 100  # symbols per comma-joined /profile/{A,B,...} call
+SHARES_TTL = 90 * 86400  # share counts move at most quarterly
+
+
+def _shares(row: Dict[str, Any]) -> Optional[float]:
+    """Positive sharesOutstanding from a profile row (legacy capitalized key as fallback)."""
+    v = to_positive_float(row.get("sharesOutstanding"))
+    if v is None:
+        v = to_positive_float(row.get("SharesOutstanding"))
+    return v
 
 
 class FMPSharesOutstandingAdapter(MetricAdapter):
@@ -32,53 +36,112 @@ class FMPSharesOutstandingAdapter(MetricAdapter):
     Parsing:
       - FMP 'profile' returns a list[ { "symbol":..., "sharesOutstanding": ... } ]
       - We return sharesOutstanding as a float.
+
+    fetch_many() asks for up to PROFILE_BATCH_SIZE comma-joined symbols per
+    /profile request. fetch(), fetch_async() and fetch_many() all read and
+    seed the same on-disk cache.
     """
 
     def __init__(self) -> None:
         self._name = "fmp_shares_outstanding"
+        self._api_key = FMP_API_KEY
 
     def get_name(self) -> str:
         return self._name
 
-    def _coerce(self, v: Optional[Any]) -> Optional[float]:
-        try:
-            if v is None:
-                return None
-            f = float(v)
-            if f != f or f <= 0:  # NaN or non-positive
-                return None
-            return f
-        except Exception:
-            return None
+    def _parse(self, ticker: str, status_code: int, content: bytes) -> float:
+        if status_code != 200:
+            raise DataNotAvailable(f"{self._name}: HTTP {status_code} for {ticker}")
+
+        data = loads(content)
+        if not isinstance(data, list) or not data:
+            raise DataNotAvailable(f"{self._name}: unexpected payload shape")
+
+        val = _shares(data[0]) if isinstance(data[0], dict) else None
+        if val is not None:
+            return val
 
+        raise DataNotAvailable(f"{self._name}: sharesOutstanding not found for {ticker}")
+
+    @disk_cache(ttl=SHARES_TTL)
     def fetch(self, ticker: str) -> float:
-        api_key = os.getenv("FINANCIAL_PREP_API_KEY")
+        api_key = self._api_key
         if not api_key:
             raise DataNotAvailable(f"{self._name}: missing FINANCIAL_PREP_API_KEY")
 
-        url = f"https://financialmodelingprep.com/api/v3/profile/{ticker.upper()}"
         try:
-            resp = requests.get(url, params={"apikey": api_key}, timeout=HTTP_TIMEOUT, headers=HEADERS)
-            if resp.status_code != 200:
-                raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for {ticker}")
-
-            data = resp.json()
-            if not isinstance(data, list) or not data:
-                raise DataNotAvailable(f"{self._name}: unexpected payload shape")
-
-            row = data[0]
-            candidates = [
-                row.get("sharesOutstanding"),
-                row.get("SharesOutstanding"),
-            ]
-            for c in candidates:
-                val = self._coerce(c)
-                if val is not None:
-                    return val
-
-            raise DataNotAvailable(f"{self._name}: sharesOutstanding not found for {ticker}")
+            resp = get_session(http2=True).get(
+                PROFILE_URL.format(tk=ticker.upper()), params={"apikey": api_key}, timeout=HTTP_TIMEOUT
+            )
+            return self._parse(ticker, resp.status_code, resp.content)
+        except DataNotAvailable:
+            raise
+        except Exception as exc:
+            raise DataNotAvailable(f"{self._name}: failed to fetch sharesOutstanding for {ticker}") from exc
+
+    async def fetch_async(self, ticker: str) -> float:
+        client = get_async_client()
+        if client is None or not self._api_key:
+            return await super().fetch_async(ticker)  # fetch() reads/writes the disk cache
 
+        # Same on-disk cache as fetch() / fetch_many()
+        hit = disk_lookup(self._name, ticker, SHARES_TTL)
+        if hit is not None:
+            return hit
+        try:
+            resp = await client.get(
+                PROFILE_URL.format(tk=ticker.upper()), params={"apikey": self._api_key}, timeout=HTTP_TIMEOUT
+            )
+            val = self._parse(ticker, resp.status_code, resp.content)
+            disk_store(self._name, ticker, val)
+            return val
         except DataNotAvailable:
             raise
         except Exception as exc:
             raise DataNotAvailable(f"{self._name}: failed to fetch sharesOutstanding for {ticker}") from exc
+
+    def _fetch_batch(self, symbols: List[str]) -> Dict[str, Any]:
+        """One comma-joined /profile call -> {SYMBOL: profile row}."""
+        resp = get_session(http2=True).get(
+            PROFILE_URL.format(tk=",".join(symbols)), params={"apikey": self._api_key}, timeout=HTTP_TIMEOUT
+        )
+        if resp.status_code != 200:
+            raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code} for batch profile")
+        data = loads(resp.content)
+        if not isinstance(data, list):
+            raise DataNotAvailable(f"{self._name}: unexpected batch profile payload")
+        return {str(r.get("symbol", "")).upper(): r for r in data if isinstance(r, dict)}
+
+    def fetch_many(
+        self, tickers: Iterable[str], concurrency: Optional[int] = None
+    ) -> Dict[str, float | BaseException]:
+        symbols = list(dict.fromkeys(tickers))
+        if not self._api_key or len(symbols) <= 1:
+            return super().fetch_many(symbols, concurrency)
+
+        out: Dict[str, float | BaseException] = {}
+        pending: List[str] = []
+        for tk in symbols:
+            hit = disk_lookup(self._name, tk, SHARES_TTL)
+            if hit is None:
+                pending.append(tk)
+            else:
+                out[tk] = hit
+
+        for i in range(0, len(pending), PROFILE_BATCH_SIZE):
+            chunk = pending[i:i + PROFILE_BATCH_SIZE]
+            try:
+                rows = self._fetch_batch([tk.upper() for tk in chunk])
+            except Exception:
+                # Batch request rejected (plan limits, outage): per-ticker path
+                out.update(super().fetch_many(chunk, concurrency))
+                continue
+            for tk in chunk:
+                row = rows.get(tk.upper())
+                val = _shares(row) if row is not None else None
+                if val is None:
+                    out[tk] = DataNotAvailable(f"{self._name}: sharesOutstanding not found for {tk}")
+                else:
+                    disk_store(self._name, tk, val)
+                    out[tk] = val
+        return {tk: out[tk] for tk in symbols}
@@ -1,12 +1,13 @@
 # adapters/shares_outstanding_adapter/yfinance_shares_outstanding_adapter.py
 from __future__ import annotations
 
-from typing import Any, Optional
-
-import yfinance as yf
-
+from adapters._cache import disk_cache, ttl_cache
+from adapters._fast import to_positive_float
 from adapters.adapter import MetricAdapter, DataNotAvailable, retry_on_failure
-from adapters.yf_session import get_simple_session
+from adapters.yf_bundle import get_bundle
+
+# Key spellings differ across yfinance versions; probed in order
+_FAST_INFO_KEYS = ("shares_outstanding", "sharesOutstanding", "float_shares_outstanding")
 
 
 class YFinanceSharesOutstandingAdapter(MetricAdapter):
@@ -15,8 +16,12 @@ class YFinanceSharesOutstandingAdapter(MetricAdapter):
 
     Strategy:
       - Prefer fast_info['shares_outstanding'] (newer yfinance).
-      - Fallback to get_info()['sharesOutstanding'] or legacy .info['sharesOutstanding'].
+      - Then the quoteSummary defaultKeyStatistics module (shared via adapters.yf_bundle).
+      - Fallback to .info['sharesOutstanding'] (one scrape per ticker, shared via the bundle).
       - Returns a positive float; raises DataNotAvailable on failure.
+      - Results are also memoized in memory, so the BVPS adapter (which divides
+        by this adapter's value) and the shares metric itself share one lookup
+        per ticker even when the disk cache is off.
     """
 
     def __init__(self) -> None:
@@ -25,59 +30,45 @@ class YFinanceSharesOutstandingAdapter(MetricAdapter):
     def get_name(self) -> str:
         return self._name
 
-    def _coerce(self, v: Optional[Any]) -> Optional[float]:
-        try:
-            if v is None:
-                return None
-            f = float(v)
-            if f != f or f <= 0:  # NaN or non-positive
-                return None
-            return f
-        except Exception:
-            return None
-
+    @ttl_cache(ttl=300)
+    @disk_cache(ttl=90 * 86400)
     @retry_on_failure(max_retries=3, delay=0.5)
     def fetch(self, ticker: str) -> float:
         try:
-            session = get_simple_session()
-            t = yf.Ticker(ticker, session=session)
+            b = get_bundle(ticker)
+            t = b.ticker
 
             # 1) fast_info (if present)
-            fi = getattr(t, "fast_info", None)
-            if fi is not None:
-                for key in ("shares_outstanding", "sharesOutstanding", "float_shares_outstanding"):
+            fi_get = getattr(getattr(t, "fast_info", None), "get", None)
+            if fi_get is not None:
+                for key in _FAST_INFO_KEYS:
                     try:
-                        val = fi.get(key) if hasattr(fi, "get") else None
+                        val = fi_get(key)
                     except Exception:
                         val = None
-                    v = self._coerce(val)
+                    v = to_positive_float(val)
                     if v is not None:
                         return v
 
-            # 2) get_info() (preferred)
-            info = None
-            if hasattr(t, "get_info"):
-                try:
-                    info = t.get_info()
-                except Exception:
-                    info = None
-
-            # 3) legacy .info
-            if info is None:
-                try:
-                    info = t.info  # type: ignore[attr-defined]
-                except Exception:
-                    info = None
-
-            if isinstance(info, dict):
-                candidates = [
-                    info.get("sharesOutstanding"),
-                    info.get("SharesOutstanding"),
-                ]
-                for c in candidates:
-                    v = self._coerce(c)
-                    if v is not None:
-                        return v
+            # 2) defaultKeyStatistics (narrow request, cached on the bundle)
+            try:
+                v = to_positive_float(b.quote_module("defaultKeyStatistics").get("sharesOutstanding"))
+            except Exception:
+                v = None
+            if v is not None:
+                return v
+
+            # 3) full .info (shared with the other adapters via the bundle)
+            try:
+                info = b.info()
+            except Exception:
+                info = {}
+            # Capitalized key is a fallback for any unusable value, not just a missing one
+            v = to_positive_float(info.get("sharesOutstanding"))
+            if v is None:
+                v = to_positive_float(info.get("SharesOutstanding"))
+            if v is not None:
+                return v
 
             raise DataNotAvailable(f"{self._name}: sharesOutstanding not available for {ticker}")
 
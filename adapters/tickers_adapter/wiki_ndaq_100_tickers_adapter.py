@@ -1,17 +1,14 @@
 # adapters/tickers_adapter/wiki_ndaq_100_tickers_adapter.py
 from __future__ import annotations
 
-import io
 from typing import List
 
-import requests
-import pandas as pd
-
+from adapters._http import get_session
+from adapters._wiki import table_column
 from adapters.adapter import TickersAdapter, DataNotAvailable
 
 WIKI_NDQ100_URL = "https://en.wikipedia.org/wiki/Nasdaq-100"
 HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
 
 
 class WikiNDAQ100TickersAdapter(TickersAdapter):
@@ -29,27 +26,16 @@ class WikiNDAQ100TickersAdapter(TickersAdapter):
 
     def fetch(self) -> List[str]:
         try:
-            resp = requests.get(WIKI_NDQ100_URL, timeout=HTTP_TIMEOUT, headers=HEADERS)
+            resp = get_session().get(WIKI_NDQ100_URL, timeout=HTTP_TIMEOUT)
             if resp.status_code != 200:
                 raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code}")
 
-            tables = pd.read_html(io.StringIO(resp.text), flavor="lxml")
-            candidates = [t for t in tables if any(str(col).lower() in ("ticker", "symbol") for col in t.columns)]
-            if not candidates:
+            # Parse just the constituents column with lxml (no DataFrames)
+            cells = table_column(resp.content, ("Ticker", "Symbol"))
+            if cells is None:
                 raise DataNotAvailable(f"{self._name}: could not locate table with Ticker/Symbol")
 
-            df = candidates[0]
-            col = "Ticker" if "Ticker" in df.columns else ("Symbol" if "Symbol" in df.columns else None)
-            if col is None:
-                raise DataNotAvailable(f"{self._name}: missing Ticker/Symbol column")
-
-            symbols = (
-                df[col]
-                .astype(str)
-                .str.strip()
-                .str.upper()
-                .tolist()
-            )
+            symbols = [c.upper() for c in cells]
 
             symbols = [s for s in symbols if s and s != "NAN"]
             symbols = list(dict.fromkeys(symbols))
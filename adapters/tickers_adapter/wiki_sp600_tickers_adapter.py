@@ -1,17 +1,14 @@
 # adapters/tickers_adapter/wiki_sp600_tickers_adapter.py
 from __future__ import annotations
 
-import io
 from typing import List
 
-import requests
-import pandas as pd
-
+from adapters._http import get_session
+from adapters._wiki import table_column
 from adapters.adapter import TickersAdapter, DataNotAvailable
 
 WIKI_SP600_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_600_companies"
 HTTP_TIMEOUT = 15
-HEADERS = {"User-Agent": "ampyfin-val-model/1.0 (+https://example.org)"}
 
 
 class WikiSP600TickersAdapter(TickersAdapter):
@@ -32,29 +29,16 @@ class WikiSP600TickersAdapter(TickersAdapter):
 
     def fetch(self) -> List[str]:
         try:
-            resp = requests.get(WIKI_SP600_URL, timeout=HTTP_TIMEOUT, headers=HEADERS)
+            resp = get_session().get(WIKI_SP600_URL, timeout=HTTP_TIMEOUT)
             if resp.status_code != 200:
                 raise DataNotAvailable(f"{self._name}: HTTP {resp.status_code}")
 
-            # Use pandas to parse the first table containing a 'Symbol' column
-            tables = pd.read_html(io.StringIO(resp.text), flavor="lxml")
-            candidates = [t for t in tables if any(str(col).lower() in ("symbol", "ticker") for col in t.columns)]
-            if not candidates:
+            # Parse just the constituents column with lxml (no DataFrames)
+            cells = table_column(resp.content, ("Symbol", "Ticker"))
+            if cells is None:
                 raise DataNotAvailable(f"{self._name}: could not locate table with Symbol/Ticker")
 
-            df = candidates[0]
-            # Prefer 'Symbol' column; fallback to 'Ticker'
-            col = "Symbol" if "Symbol" in df.columns else ("Ticker" if "Ticker" in df.columns else None)
-            if col is None:
-                raise DataNotAvailable(f"{self._name}: missing Symbol/Ticker column")
-
-            symbols = (
-                df[col]
-                .astype(str)
-                .str.strip()
-                .str.upper()
-                .tolist()
-            )
+            symbols = [c.upper() for c in cells]
 
             # Basic sanitation: drop blanks, de-duplicate
             symbols = [s for s in symbols if s and s != "NAN"]
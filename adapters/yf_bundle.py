@@ -0,0 +1,205 @@
+# adapters/yf_bundle.py
+"""
+AmpyFin — Val Model
+Per-ticker yfinance bundle shared by the yfinance metric adapters.
+
+Several adapters read the same statement for one ticker (EBIT, gross profit
+and EPS all come from the quarterly income statement). The bundle downloads
+each statement once, sorts its columns most-recent-first, and indexes rows by
+a normalized label so lookups like 'EBIT' / 'Ebit' / 'Operating Income' are a
+dict hit instead of a scan over candidate spellings. values() additionally
+memoizes a row's numeric coercion, so adapters reading the same row (revenue
+feeds TTM, last quarter, YoY growth and the D&A fallback) coerce it once.
+
+Statements are loaded lazily on first access (an adapter that only needs the
+cash-flow statement never pays for the balance sheet) and memoized for the
+lifetime of the bundle. Failed downloads are not memoized.
+
+Single quoteSummary modules (e.g. defaultKeyStatistics for trailingEps /
+sharesOutstanding) are available via quote_module(), which requests just that
+module instead of the full multi-module .info scrape. Adapters that do need
+.info read it through info(), so concurrent adapters share one scrape.
+"""
+
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from adapters._cache import TTLCache, memoize
+from adapters.yf_session import get_ticker
+
+# statement kind -> yf.Ticker getter (called with freq=..., pretty=True)
+_STATEMENT_GETTERS = {
+    "income": "get_income_stmt",
+    "balance": "get_balance_sheet",
+    "cashflow": "get_cash_flow",
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_label(label: Any) -> str:
+    """
+    'Operating Income' / 'OperatingIncome' / 'operating_income' -> 'operatingincome'.
+    Memoized: the same statement labels and adapter label tuples recur for every ticker.
+    """
+    return "".join(ch for ch in str(label).lower() if ch.isalnum())
+
+
+def _sort_cols_desc_by_date(df: pd.DataFrame) -> pd.DataFrame:
+    cols_dt = pd.to_datetime(df.columns, errors="coerce")
+    order = pd.Series(cols_dt, index=df.columns).sort_values(ascending=False).index
+    return df.loc[:, order]
+
+
+def row_array(row: pd.Series) -> np.ndarray:
+    """Statement row as float64, column order kept; non-numeric cells become NaN."""
+    if row.dtype.kind in "fiu":  # already numeric: skip the to_numeric Series copy
+        return row.to_numpy(dtype="float64", na_value=np.nan)
+    return pd.to_numeric(row, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+
+def recent_values(row: pd.Series, n: int = 4) -> np.ndarray:
+    """
+    Up to `n` most-recent finite values of a statement row as float64
+    (bundle columns are newest-first). Non-numeric cells and NaN/inf are dropped.
+    """
+    arr = row_array(row)
+    return arr[np.isfinite(arr)][:n]
+
+
+# One bundle per ticker is kept alive in _BUNDLES: drop the per-instance
+# __dict__ where dataclasses can generate __slots__ (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
+class YFBundle:
+    symbol: str
+    ticker: Any
+    _frames: Dict[Tuple[str, str], pd.DataFrame] = field(default_factory=dict, repr=False)
+    _row_index: Dict[Tuple[str, str], Dict[str, Any]] = field(default_factory=dict, repr=False)
+    _modules: Dict[str, Dict[str, Any]] = field(default_factory=dict, repr=False)
+    _info: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    _values: Dict[Tuple[str, str, Any], np.ndarray] = field(default_factory=dict, repr=False)
+    _locks: Dict[Tuple[str, str], threading.Lock] = field(default_factory=dict, repr=False)
+    _guard: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def _lock_for(self, key: Tuple[str, str]) -> threading.Lock:
+        with self._guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = threading.Lock()
+            return lock
+
+    def statement(self, kind: str, freq: str = "quarterly") -> Optional[pd.DataFrame]:
+        """
+        Return the statement DataFrame (columns most-recent-first) or None when
+        yfinance has nothing for this ticker. Exceptions from yfinance propagate.
+        """
+        key = (kind, freq)
+        if key in self._frames:
+            return self._frames[key]
+        with self._lock_for(key):
+            if key in self._frames:
+                return self._frames[key]
+            getter = getattr(self.ticker, _STATEMENT_GETTERS[kind])
+            df = getter(freq=freq, pretty=True)
+            if isinstance(df, pd.DataFrame) and not df.empty:
+                df = _sort_cols_desc_by_date(df)
+                index: Dict[str, Any] = {}
+                for ix in df.index:
+                    index.setdefault(normalize_label(ix), ix)
+                self._row_index[key] = index
+            else:
+                df = None
+                self._row_index[key] = {}
+            self._frames[key] = df
+            return df
+
+    def quote_module(self, module: str) -> Dict[str, Any]:
+        """
+        One quoteSummary module as a flat dict ({} if Yahoo returns nothing).
+        Values of the form {"raw": x, "fmt": ...} are unwrapped to x.
+        """
+        if module in self._modules:
+            return self._modules[module]
+        with self._lock_for(("quote", module)):
+            if module in self._modules:
+                return self._modules[module]
+            # yfinance's quote scraper handles cookie/crumb for the narrow request
+            raw = self.ticker._quote._fetch([module])
+            try:
+                data = raw["quoteSummary"]["result"][0][module]
+            except Exception:
+                data = None
+            out: Dict[str, Any] = {}
+            if isinstance(data, dict):
+                for k, v in data.items():
+                    out[k] = v.get("raw") if isinstance(v, dict) else v
+            self._modules[module] = out
+            return out
+
+    def info(self) -> Dict[str, Any]:
+        """
+        Ticker.info ({} if Yahoo returns nothing), fetched once per bundle even
+        when several adapters ask concurrently. Exceptions propagate.
+        """
+        if self._info is not None:
+            return self._info
+        with self._lock_for(("info", "")):
+            if self._info is None:
+                info = self.ticker.info
+                self._info = info if isinstance(info, dict) else {}
+            return self._info
+
+    def row(self, kind: str, labels: Iterable[str], freq: str = "quarterly") -> Optional[pd.Series]:
+        """First row matching any of `labels` (compared normalized), else None."""
+        df = self.statement(kind, freq)
+        if df is None:
+            return None
+        index = self._row_index[(kind, freq)]
+        for lbl in labels:
+            ix = index.get(normalize_label(lbl))
+            if ix is not None:
+                return df.loc[ix]
+        return None
+
+    def values(self, kind: str, labels: Iterable[str], freq: str = "quarterly") -> Optional[np.ndarray]:
+        """
+        Finite values of the first row matching `labels`, newest-first, as a
+        read-only float64 array (recent_values() without the cut), memoized per
+        row. None when no row matches; empty when the row has no usable cells.
+        """
+        df = self.statement(kind, freq)
+        if df is None:
+            return None
+        index = self._row_index[(kind, freq)]
+        for lbl in labels:
+            ix = index.get(normalize_label(lbl))
+            if ix is None:
+                continue
+            key = (kind, freq, ix)
+            arr = self._values.get(key)
+            if arr is None:
+                arr = row_array(df.loc[ix])
+                arr = arr[np.isfinite(arr)]
+                arr.setflags(write=False)
+                self._values[key] = arr
+            return arr
+        return None
+
+
+_BUNDLES = TTLCache(maxsize=1024, ttl=300.0)
+
+
+def get_bundle(ticker: str) -> YFBundle:
+    """Return the shared (briefly cached) bundle for `ticker`."""
+    sym = str(ticker).upper()
+    return memoize(_BUNDLES, sym, lambda: YFBundle(symbol=sym, ticker=get_ticker(sym)))
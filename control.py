@@ -16,12 +16,18 @@ broadcast_port = 5002
 # --- Loop timing ---
 LOOP_SLEEP_SECONDS = 180       # delay between runs when Run_continous=True
 
+# --- Fetch mode ---
+Async_fetch = False            # if True: fetch every metric/ticker on one asyncio event loop
+async_fetch_concurrency = 16   # in-flight fetches per metric in async mode
+
 # --- Back-compat/normalized constants used by stages ---
 RUN_CONTINUOUS = bool(Run_continous)
 GUI_MODE = bool(Gui_mode)
 BROADCAST_MODE = bool(Broadcast_mode)
 BROADCAST_NETWORK = broadcast_network
 BROADCAST_PORT = int(broadcast_port)
+ASYNC_FETCH = bool(Async_fetch)
+ASYNC_FETCH_CONCURRENCY = int(async_fetch_concurrency)
 
 # --- JSON dump (optional) ---
 Json_dump_enable = True      # True = write a JSON file each run
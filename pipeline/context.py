@@ -42,6 +42,8 @@ class PipelineContext:
 
     fair_values: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
     strategy_errors: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    # Same values as a float64 ndarray [tickers x strategy_names], NaN = no value
+    fair_value_matrix: Optional[Any] = None
 
     # ---- Result stage outputs ----
     results_by_ticker: Dict[str, Dict[str, Any]] = field(default_factory=dict)
@@ -68,6 +70,7 @@ class PipelineContext:
         self.strategy_names.clear()
         self.fair_values.clear()
         self.strategy_errors.clear()
+        self.fair_value_matrix = None
 
     def reset_results(self) -> None:
         self.results_by_ticker.clear()
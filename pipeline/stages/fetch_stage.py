@@ -7,15 +7,24 @@ Responsibility:
 - Decide which tickers to evaluate (via registries.adapter_registry active tickers adapter)
 - Decide which metrics to fetch (union of required metrics from enabled strategies
   + always include 'current_price' for downstream comparisons)
-- Call the ACTIVE adapter for each metric and ticker
+- Call the ACTIVE adapter for each metric, fanning out over tickers concurrently;
+  metrics are fetched side by side (METRIC_FANOUT at a time), so a ticker's
+  wall time is roughly its slowest metric rather than the sum of all of them.
+  With control.ASYNC_FETCH every metric and ticker instead shares one asyncio
+  event loop (MetricAdapter.fetch_many_async), which keeps hundreds of
+  requests in flight without a thread per request.
 - Write results into PipelineContext (no valuation logic here).
 """
 
 from __future__ import annotations
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 
-from adapters.adapter import DataNotAvailable
+import control
+from adapters._http import close_async_client
+from adapters.adapter import DataNotAvailable, MetricAdapter
 from pipeline.context import PipelineContext
 from registries.adapter_registry import (
     get_active_tickers_adapter,
@@ -26,6 +35,9 @@ from registries.strategy_registry import (
     get_required_metrics,
 )
 
+# Metric adapters fetched concurrently; each one fans out over tickers itself
+METRIC_FANOUT = 6
+
 
 def _collect_required_metrics() -> List[str]:
     """
@@ -41,6 +53,37 @@ def _collect_required_metrics() -> List[str]:
     return needed
 
 
+def _fetch_many_or_error(adapter: MetricAdapter, tickers: List[str]) -> Any:
+    try:
+        return adapter.fetch_many(tickers)
+    except Exception as e:  # pragma: no cover - fetch_many reports per ticker
+        return e
+
+
+def _fetch_threaded(adapters: Dict[str, MetricAdapter], tickers: List[str]) -> Dict[str, Any]:
+    """{metric: fetch_many() result, or the exception it raised}."""
+    if not adapters:
+        return {}
+    # Results are keyed by metric, so completion order is irrelevant: map()
+    # over the adapters instead of tracking one future per metric
+    with ThreadPoolExecutor(max_workers=max(1, min(METRIC_FANOUT, len(adapters)))) as ex:
+        results = ex.map(_fetch_many_or_error, adapters.values(), [tickers] * len(adapters))
+        return dict(zip(adapters, results))
+
+
+async def _fetch_async(adapters: Dict[str, MetricAdapter], tickers: List[str]) -> Dict[str, Any]:
+    """Async counterpart of _fetch_threaded(): all metrics gathered on one loop."""
+    limit = getattr(control, "ASYNC_FETCH_CONCURRENCY", 16)
+    try:
+        results = await asyncio.gather(
+            *(a.fetch_many_async(tickers, limit) for a in adapters.values()),
+            return_exceptions=True,
+        )
+    finally:
+        await close_async_client()
+    return dict(zip(adapters, results))
+
+
 def run_fetch_stage(ctx: PipelineContext) -> PipelineContext:
     """
     Execute the fetch stage and mutate ctx in-place.
@@ -55,35 +98,45 @@ def run_fetch_stage(ctx: PipelineContext) -> PipelineContext:
     # 2) Metrics required by strategies (+ current_price)
     ctx.required_metrics = _collect_required_metrics()
 
-    # 3) Fetch data
-    metrics_by_ticker: Dict[str, Dict[str, float | None]] = {}
+    # 3) Fetch data — one adapter per metric, metrics and tickers fanned out concurrently
+    metrics_by_ticker: Dict[str, Dict[str, float | None]] = {tk: {} for tk in ctx.tickers}
     errors: Dict[str, Dict[str, str]] = {}
 
-    for tk in ctx.tickers:
-        per_ticker: Dict[str, float | None] = {}
-        per_ticker_errs: Dict[str, str] = {}
-
-        for metric in ctx.required_metrics:
-            adapter = get_active_metric_adapter(metric) if metric != "rule40_score" else None
-
-            # 'rule40_score' is a computed/externally-supplied metric; skip adapter fetch (leave None)
-            if metric == "rule40_score":
-                per_ticker[metric] = None
-                continue
-
-            try:
-                value = adapter.fetch(tk)  # type: ignore[union-attr]
-                per_ticker[metric] = float(value)
-            except DataNotAvailable as e:
-                per_ticker[metric] = None
-                per_ticker_errs[metric] = str(e)
-            except Exception as e:  # pragma: no cover
-                per_ticker[metric] = None
-                per_ticker_errs[metric] = f"unexpected error: {e}"
-
-        metrics_by_ticker[tk] = per_ticker
-        if per_ticker_errs:
-            errors[tk] = per_ticker_errs
+    # 'rule40_score' is a computed/externally-supplied metric; skip adapter fetch (leave None)
+    adapters = {m: get_active_metric_adapter(m) for m in ctx.required_metrics if m != "rule40_score"}
+    if getattr(control, "ASYNC_FETCH", False):
+        fetched = asyncio.run(_fetch_async(adapters, ctx.tickers))
+    else:
+        fetched = _fetch_threaded(adapters, ctx.tickers)
+
+    # One pass per metric over the per-ticker rows (row dicts bound once, not
+    # looked up again for every cell)
+    for metric in ctx.required_metrics:
+        if metric not in fetched:
+            for row in metrics_by_ticker.values():
+                row[metric] = None
+            continue
+
+        results = fetched[metric]
+        if isinstance(results, BaseException):  # pragma: no cover
+            results = {tk: results for tk in ctx.tickers}
+
+        for tk, row in metrics_by_ticker.items():
+            value = results.get(tk)
+            if type(value) is float:  # common case: adapters return floats
+                row[metric] = value
+            elif isinstance(value, DataNotAvailable):
+                row[metric] = None
+                errors.setdefault(tk, {})[metric] = str(value)
+            elif isinstance(value, BaseException):  # pragma: no cover
+                row[metric] = None
+                errors.setdefault(tk, {})[metric] = f"unexpected error: {value}"
+            else:
+                try:
+                    row[metric] = float(value)  # type: ignore[arg-type]
+                except Exception as e:  # pragma: no cover
+                    row[metric] = None
+                    errors.setdefault(tk, {})[metric] = f"unexpected error: {e}"
 
     ctx.metrics_by_ticker = metrics_by_ticker
     ctx.fetch_errors = errors
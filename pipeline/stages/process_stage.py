@@ -7,12 +7,19 @@ Responsibility:
 - Instantiate enabled strategies (from strategy registry).
 - For each ticker, gather inputs from ctx.metrics_by_ticker, merge with
   default + override hyperparameters, then run strategy.run(params) to compute fair value.
+  Strategies with a vectorized run_many() value every ticker in one NumPy pass
+  over per-metric columns; tickers it leaves non-finite (missing or invalid
+  inputs) go through run() so values and error messages are unchanged.
 - Write results into ctx.fair_values and ctx.strategy_errors (no I/O here).
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import math
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
 
 from pipeline.context import PipelineContext
 from registries.strategy_registry import (
@@ -22,6 +29,36 @@ from registries.strategy_registry import (
 )
 from strategies.strategy import Strategy, StrategyInputError
 
+# Shared read-only stand-in for tickers without fetched metrics
+_NO_METRICS: Mapping[str, Any] = MappingProxyType({})
+
+
+def _metric_columns(rows: List[Mapping[str, Any]]) -> Dict[str, np.ndarray]:
+    """{metric: float64 array over rows}, None/missing -> NaN; non-numeric metrics are left out."""
+    keys = list(dict.fromkeys(k for row in rows for k in row))
+    columns: Dict[str, np.ndarray] = {}
+    for key in keys:
+        try:
+            columns[key] = np.array([row.get(key) for row in rows], dtype=np.float64)
+        except (TypeError, ValueError):
+            continue
+    return columns
+
+
+def _run_vectorized(strat: Strategy, columns: Dict[str, np.ndarray], hp: Dict[str, Any], n: int) -> Optional[np.ndarray]:
+    """strat.run_many() result, or None when it has none or cannot handle these inputs."""
+    if hp.keys() & columns.keys():
+        # run() sees the hyperparameter, not the metric, under a shared key
+        columns = {k: v for k, v in columns.items() if k not in hp}
+    try:
+        out = strat.run_many(columns, hp)
+    except Exception:
+        return None
+    if out is None:
+        return None
+    out = np.asarray(out, dtype=np.float64)
+    return out if out.shape == (n,) else None
+
 
 def run_process_stage(
     ctx: PipelineContext,
@@ -46,27 +83,51 @@ def run_process_stage(
     # Strategy lineup
     ctx.strategy_names = get_enabled_strategy_names()
 
+    # Strategies are stateless and their hyperparameters do not depend on the
+    # ticker: build each one (and its defaults + overrides) once per run.
+    lineup: List[Tuple[str, Strategy, Dict[str, Any]]] = []
+    for sname in ctx.strategy_names:
+        hp: Dict[str, Any] = get_default_hyperparams(sname)
+        hp.update(ctx.hyperparam_overrides.get(sname, {}))
+        lineup.append((sname, get_strategy_factory(sname)(), hp))
+
+    # Each ticker's metrics row, looked up once for the columns and the scalar path
+    metrics_by_ticker = ctx.metrics_by_ticker
+    rows = [metrics_by_ticker.get(tk) or _NO_METRICS for tk in ctx.tickers]
+    columns = _metric_columns(rows)
+    n = len(ctx.tickers)
+    # Vectorized pass per strategy; None -> every ticker goes through run()
+    vectorized = [_run_vectorized(strat, columns, hp, n) if columns else None for _, strat, hp in lineup]
+
+    # The result stage's [ticker x strategy] matrix, filled as values are
+    # produced (whole columns from run_many) so it never re-scans fair_values
+    matrix = np.full((n, len(lineup)), np.nan)
+    for j, out in enumerate(vectorized):
+        if out is not None:
+            matrix[:, j] = np.where(np.isfinite(out), out, np.nan)
+
     fair_values: Dict[str, Dict[str, float | None]] = {}
     errors: Dict[str, Dict[str, str]] = {}
 
-    for tk in ctx.tickers:
+    for i, (tk, metrics) in enumerate(zip(ctx.tickers, rows)):
         per_ticker: Dict[str, float | None] = {}
         per_ticker_errs: Dict[str, str] = {}
-        metrics = ctx.metrics_by_ticker.get(tk, {})
 
-        for sname in ctx.strategy_names:
-            factory = get_strategy_factory(sname)
-            strat: Strategy = factory()
+        for j, ((sname, strat, hp), out) in enumerate(zip(lineup, vectorized)):
+            if out is not None:
+                fv = float(out[i])
+                if math.isfinite(fv):
+                    per_ticker[sname] = fv
+                    continue
 
-            # Build params dict from metrics + defaults + overrides
-            params: Dict[str, Any] = {}
-            params.update(metrics)  # includes metric keys like 'eps_ttm', etc.
-            params.update(get_default_hyperparams(sname))
-            params.update(ctx.hyperparam_overrides.get(sname, {}))
+            # Build params dict from metrics + defaults + overrides (one copy of
+            # the metrics row, then the strategy's hyperparameters on top)
+            params: Dict[str, Any] = metrics | hp  # metric keys like 'eps_ttm', etc.
 
             try:
                 fv = float(strat.run(params))
                 per_ticker[sname] = fv
+                matrix[i, j] = fv
             except StrategyInputError as e:
                 per_ticker[sname] = None
                 per_ticker_errs[sname] = str(e)
@@ -79,5 +140,6 @@ def run_process_stage(
             errors[tk] = per_ticker_errs
 
     ctx.fair_values = fair_values
+    ctx.fair_value_matrix = matrix
     ctx.strategy_errors = errors
     return ctx
@@ -10,73 +10,74 @@ Outputs per run:
   * Console summary (with P25/P75)
   * Optional UDP broadcast (if Broadcast_mode=True)
   * Optional JSON dump (if Json_dump_enable=True in control.py)
+    Both JSON outputs are encoded with orjson when installed (same document,
+    NaN written as null); otherwise json.dump streams the file as it encodes.
   * Optional MongoDB storage (if MONGODB_ENABLE=True in control.py)
   * Optional minimal GUI (single-shot) and full live GUI (ui.viewer)
 """
 
 from __future__ import annotations
 
-import math
+import heapq
 import os
 import socket
-import statistics
 import time
+import warnings
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson  # optional: much faster encoder for the JSON outputs
+except ImportError:  # pragma: no cover
+    orjson = None
 
 import control
 from pipeline.context import PipelineContext
 from pipeline.stages.mongodb_storage import store_results_in_mongodb
 
+# Rows listed under "Top (potentially) undervalued" in the console summary
+TOP_UNDERVALUED = 5
 
-def _median_ignoring_none(values: List[Optional[float]]) -> Optional[float]:
-    vals = [v for v in values if isinstance(v, (int, float)) and not math.isnan(float(v))]
-    if not vals:
-        return None
-    try:
-        return float(statistics.median(vals))
-    except Exception:
-        return None
 
+def _fair_value_matrix(
+    tickers: List[str], strategy_names: List[str], fair_values: Dict[str, Dict[str, Optional[float]]]
+) -> np.ndarray:
+    """fv[T, S] as float64, one row per ticker; None/non-numeric entries become NaN."""
+    fv = np.full((len(tickers), len(strategy_names)), np.nan)
+    for i, tk in enumerate(tickers):
+        fair_map = fair_values.get(tk) or {}
+        for j, sname in enumerate(strategy_names):
+            v = fair_map.get(sname)
+            if isinstance(v, (int, float)):
+                fv[i, j] = v
+    return fv
 
-def _percentile(values: List[Optional[float]], p: float) -> Optional[float]:
+
+def _consensus_table(fv: np.ndarray, prices: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Linear interpolation percentile: p in [0,1].
-    Ignores None/NaN. Returns None if no data.
+    Row-wise median / P25 / P75 (linear interpolation, NaN ignored) plus
+    fair/price - 1 over a whole run at once: (median, P25, P75, discount)
+    arrays of length T, NaN where undefined.
     """
-    xs = [float(v) for v in values if isinstance(v, (int, float)) and not math.isnan(float(v))]
-    n = len(xs)
-    if n == 0:
-        return None
-    xs.sort()
-    if n == 1:
-        return xs[0]
-    p = max(0.0, min(1.0, float(p)))
-    idx = (n - 1) * p
-    lo = int(math.floor(idx))
-    hi = int(math.ceil(idx))
-    if lo == hi:
-        return xs[lo]
-    frac = idx - lo
-    return xs[lo] + (xs[hi] - xs[lo]) * frac
-
-
-def _pct_diff(fair: Optional[float], price: Optional[float]) -> Optional[float]:
-    if fair is None or price is None:
-        return None
-    if price == 0:
-        return None
-    try:
-        return (fair / price) - 1.0
-    except Exception:
-        return None
+    if fv.shape[1] == 0:
+        empty = np.full(fv.shape[0], np.nan)
+        return empty, empty, empty, empty
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN rows -> NaN
+        p50, p25, p75 = np.nanpercentile(fv, (50.0, 25.0, 75.0), axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        disc = np.where(prices != 0, p50 / prices - 1.0, np.nan)
+    return p50, p25, p75, disc
 
 
 def _console_print_summary(ctx: PipelineContext) -> None:
     """Console table: adds P25/P75 columns."""
     rows: List[Tuple[str, Optional[float], Optional[float], Optional[float], Optional[float], Optional[float]]] = []
+    results_by_ticker = ctx.results_by_ticker
     for tk in ctx.tickers:
-        bt = ctx.results_by_ticker.get(tk, {})
+        bt = results_by_ticker.get(tk) or {}
         rows.append(
             (
                 tk,
@@ -106,13 +107,12 @@ def _console_print_summary(ctx: PipelineContext) -> None:
 
     print("-" * 84)
 
-    # Top 5 most undervalued by consensus
-    scored = [(tk, ctx.results_by_ticker.get(tk, {}).get("consensus_discount")) for tk in ctx.tickers]
-    scored = [x for x in scored if isinstance(x[1], (int, float))]
-    scored.sort(key=lambda x: x[1], reverse=True)
-    if scored:
+    # Top TOP_UNDERVALUED most undervalued by consensus
+    scored = [(tk, disc) for tk, _, _, disc, _, _ in rows if isinstance(disc, (int, float))]
+    top = heapq.nlargest(TOP_UNDERVALUED, scored, key=lambda x: x[1])  # == full sort + slice, O(N log K)
+    if top:
         print("Top (potentially) undervalued by consensus:")
-        for tk, s in scored[:5]:
+        for tk, s in top:
             print(f"  {tk}: {s*100:.1f}%")
     print()
 
@@ -120,7 +120,6 @@ def _console_print_summary(ctx: PipelineContext) -> None:
 def _broadcast_udp(ctx: PipelineContext) -> Optional[str]:
     """Broadcast results over UDP as a compact JSON-like string (without file writing)."""
     try:
-        import json
         payload_obj = {
             "generated_at": ctx.generated_at,
             "generated_at_iso": ctx.generated_at_iso,
@@ -130,7 +129,12 @@ def _broadcast_udp(ctx: PipelineContext) -> Optional[str]:
             "fetch_errors": ctx.fetch_errors,
             "strategy_errors": ctx.strategy_errors,
         }
-        payload = json.dumps(payload_obj, separators=(",", ":")).encode("utf-8")
+        if orjson is not None:
+            payload = orjson.dumps(payload_obj)
+        else:
+            import json
+
+            payload = json.dumps(payload_obj, separators=(",", ":")).encode("utf-8")
         addr = (
             getattr(control, "BROADCAST_NETWORK", "127.0.0.1"),
             int(getattr(control, "BROADCAST_PORT", 5002)),
@@ -149,8 +153,6 @@ def _dump_json(ctx: PipelineContext) -> Optional[str]:
     if not getattr(control, "JSON_DUMP_ENABLE", False):
         return None
     try:
-        import json
-
         out_dir = getattr(control, "JSON_DUMP_DIR", "out") or "out"
         os.makedirs(out_dir, exist_ok=True)
 
@@ -168,8 +170,14 @@ def _dump_json(ctx: PipelineContext) -> Optional[str]:
             "strategy_errors": ctx.strategy_errors,
         }
 
-        with open(fpath, "w", encoding="utf-8") as f:
-            json.dump(payload_obj, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            with open(fpath, "wb") as fb:
+                fb.write(orjson.dumps(payload_obj, option=orjson.OPT_INDENT_2))
+        else:
+            import json
+
+            with open(fpath, "w", encoding="utf-8") as f:
+                json.dump(payload_obj, f, indent=2, ensure_ascii=False)
 
         print(f"[result_stage] JSON written to {fpath}")
         return fpath
@@ -251,25 +259,33 @@ def run_result_stage(ctx: PipelineContext, show_gui: Optional[bool] = None) -> P
     ctx.generated_at = now
     ctx.generated_at_iso = now_iso
 
-    # Build per-ticker results
-    for tk in ctx.tickers:
-        current_price = ctx.metrics_by_ticker.get(tk, {}).get("current_price")
-        fair_map = ctx.fair_values.get(tk, {}) or {}
-
-        values = [fair_map.get(s) for s in ctx.strategy_names]
-        cons = _median_ignoring_none(values)
-        p25 = _percentile(values, 0.25)
-        p75 = _percentile(values, 0.75)
-        disc = _pct_diff(cons, current_price)
-
-        ctx.results_by_ticker[tk] = {
-            "current_price": current_price,
-            "strategy_fair_values": fair_map,
-            "consensus_fair_value": cons,
-            "consensus_discount": disc,
-            "consensus_p25": p25,
-            "consensus_p75": p75,
+    # Build per-ticker results: consensus bands for every ticker in one pass
+    metrics_by_ticker = ctx.metrics_by_ticker
+    prices = [(metrics_by_ticker.get(tk) or {}).get("current_price") for tk in ctx.tickers]
+    fv = ctx.fair_value_matrix
+    if not isinstance(fv, np.ndarray) or fv.shape != (len(ctx.tickers), len(ctx.strategy_names)):
+        fv = _fair_value_matrix(ctx.tickers, ctx.strategy_names, ctx.fair_values)
+    price_arr = np.array([p if isinstance(p, (int, float)) else np.nan for p in prices], dtype=np.float64)
+    p50, p25, p75, disc = _consensus_table(fv, price_arr)
+
+    # One comprehension over bulk-converted columns (tolist() instead of a
+    # numpy scalar per cell); NaN -> None via v == v
+    fair_values = ctx.fair_values
+    ctx.results_by_ticker.update(
+        {
+            tk: {
+                "current_price": price,
+                "strategy_fair_values": fair_values.get(tk) or {},
+                "consensus_fair_value": cons if cons == cons else None,
+                "consensus_discount": d if d == d else None,
+                "consensus_p25": lo if lo == lo else None,
+                "consensus_p75": hi if hi == hi else None,
+            }
+            for tk, price, cons, d, lo, hi in zip(
+                ctx.tickers, prices, p50.tolist(), disc.tolist(), p25.tolist(), p75.tolist()
+            )
         }
+    )
 
     # --- Outputs ---
     _console_print_summary(ctx)
@@ -49,7 +49,7 @@ def check_mongodb_dates():
         print("=== Sample Ticker Data ===")
         by_ticker = latest_doc.get('by_ticker', {})
         if by_ticker:
-            ticker = list(by_ticker.keys())[0]
+            ticker = next(iter(by_ticker))
             ticker_data = by_ticker[ticker]
             print(f"Sample ticker ({ticker}):")
             print(f"  Current price: {ticker_data.get('current_price', 'N/A')}")
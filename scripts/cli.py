@@ -87,6 +87,7 @@ def main(argv: List[str] | None = None) -> int:
     parser.add_argument("--run-once", action="store_true", help="Run the pipeline once (default if no run flag given).")
     parser.add_argument("--loop", action="store_true", help="Run the pipeline continuously (overrides control.Run_continous).")
     parser.add_argument("--sleep", type=int, help="Seconds to sleep between runs in --loop mode (default from control.py).")
+    parser.add_argument("--async-fetch", action="store_true", help="Fetch all metrics on one asyncio event loop instead of thread pools.")
     parser.add_argument("--mongodb", action="store_true", help="Enable MongoDB storage (clears existing valuations and stores results).")
     parser.add_argument("--mongodb-uri", help="MongoDB connection string (defaults to MONGODB_URI env var or localhost:27017).")
 
@@ -110,6 +111,9 @@ def main(argv: List[str] | None = None) -> int:
         names = [s.strip() for s in args.strategies.split(",") if s.strip()]
         overrides["enabled_strategies"] = names
     
+    if args.async_fetch:
+        control.ASYNC_FETCH = True
+
     # Handle MongoDB configuration
     if args.mongodb:
         import os
@@ -88,11 +88,14 @@ class DCFGordonStrategy(Strategy):
             raise StrategyInputError(f"{self._name}: discount_rate must be > terminal_growth")
 
         # --- Project & discount FCFs
-        ev_pv = 0.0
-        fcf_t = float(fcf0)
-        for t in range(1, years + 1):
-            fcf_t = fcf_t * (1.0 + g)
-            ev_pv += fcf_t / ((1.0 + r) ** t)
+        # sum_{t=1..N} FCF0 * q^t with q = (1+g)/(1+r): closed-form geometric
+        # series instead of one power per projected year
+        q = (1.0 + g) / (1.0 + r)
+        if abs(1.0 - q) < 1e-12:
+            ev_pv = float(fcf0) * years
+        else:
+            ev_pv = float(fcf0) * q * (1.0 - q ** years) / (1.0 - q)
+        fcf_t = float(fcf0) * (1.0 + g) ** years
 
         # Terminal value at year N (as of N), then PV to today
         fcf_N_plus_1 = fcf_t * (1.0 + gT)
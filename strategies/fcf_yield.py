@@ -1,7 +1,9 @@
 # strategies/fcf_yield.py
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 from strategies.strategy import Strategy, StrategyInputError
 
@@ -61,3 +63,20 @@ class FCFYieldStrategy(Strategy):
         fcf_per_share = fcf_ttm / shares_out
         fair_value = fcf_per_share / target_yield
         return float(fair_value)
+
+    def run_many(self, columns: Dict[str, np.ndarray], hyperparams: Dict[str, Any]) -> Optional[np.ndarray]:
+        fcf_ttm = columns["fcf_ttm"]
+        shares_out = columns["shares_outstanding"]
+
+        target_yield = float(hyperparams.get("target_fcf_yield", 0.065))
+        min_yield = float(hyperparams.get("min_fcf_yield", 0.02))
+        max_yield = float(hyperparams.get("max_fcf_yield", 0.12))
+        if min_yield <= 0 or max_yield <= 0 or min_yield > max_yield:
+            return None  # run() reports the invalid clamps per ticker
+
+        target_yield = _clamp(target_yield, min_yield, max_yield)
+
+        valid = (shares_out > 0) & (fcf_ttm > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fair_value = fcf_ttm / shares_out / target_yield
+        return np.where(valid, fair_value, np.nan)
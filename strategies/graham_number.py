@@ -4,6 +4,8 @@ from __future__ import annotations
 import math
 from typing import Any, Dict, Optional
 
+import numpy as np
+
 from strategies.strategy import Strategy, StrategyInputError
 
 
@@ -19,6 +21,18 @@ def _to_float(x: Any) -> Optional[float]:
         return None
 
 
+def _multiplier(params: Dict[str, Any]) -> float:
+    mult = _to_float(params.get("graham_multiplier"))
+    if mult is None:
+        pe_cap = _to_float(params.get("graham_pe_cap", 15.0)) or 15.0
+        pb_cap = _to_float(params.get("graham_pb_cap", 1.5)) or 1.5
+        # clamp to sane ranges
+        pe_cap = max(1.0, min(40.0, pe_cap))
+        pb_cap = max(0.2, min(10.0, pb_cap))
+        mult = pe_cap * pb_cap
+    return mult
+
+
 class GrahamNumberStrategy(Strategy):
     """
     Graham Number (Benjamin Graham) — conservative fair value per share.
@@ -54,15 +68,7 @@ class GrahamNumberStrategy(Strategy):
         if bvps is None or bvps <= 0:
             raise StrategyInputError(f"{self._name}: BVPS must be > 0")
 
-        mult = _to_float(params.get("graham_multiplier"))
-        if mult is None:
-            pe_cap = _to_float(params.get("graham_pe_cap", 15.0)) or 15.0
-            pb_cap = _to_float(params.get("graham_pb_cap", 1.5)) or 1.5
-            # clamp to sane ranges
-            pe_cap = max(1.0, min(40.0, pe_cap))
-            pb_cap = max(0.2, min(10.0, pb_cap))
-            mult = pe_cap * pb_cap
-
+        mult = _multiplier(params)
         if mult <= 0:
             raise StrategyInputError(f"{self._name}: invalid multiplier")
 
@@ -71,3 +77,16 @@ class GrahamNumberStrategy(Strategy):
             return float(fv)
         except Exception as e:
             raise StrategyInputError(f"{self._name}: failed to compute") from e
+
+    def run_many(self, columns: Dict[str, np.ndarray], hyperparams: Dict[str, Any]) -> Optional[np.ndarray]:
+        eps = columns["eps_ttm"]
+        bvps = columns["book_value_per_share"]
+
+        mult = _multiplier(hyperparams)
+        if mult <= 0:
+            return None  # run() reports the invalid multiplier per ticker
+
+        valid = (eps > 0) & (bvps > 0)
+        with np.errstate(invalid="ignore"):
+            fv = np.sqrt(mult * eps * bvps)
+        return np.where(valid, fv, np.nan)
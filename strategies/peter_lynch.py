@@ -1,7 +1,9 @@
 # strategies/peter_lynch.py
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 from strategies.strategy import Strategy, StrategyInputError
 
@@ -58,3 +60,16 @@ class PeterLynchStrategy(Strategy):
 
         fair_value = eps_ttm * growth_pe
         return float(fair_value)
+
+    def run_many(self, columns: Dict[str, np.ndarray], hyperparams: Dict[str, Any]) -> Optional[np.ndarray]:
+        eps_ttm = columns["eps_ttm"]
+        eps_cagr_5y = columns["eps_cagr_5y"]
+
+        min_growth_pe = float(hyperparams.get("min_growth_pe", 5.0))
+        max_growth_pe = float(hyperparams.get("max_growth_pe", 35.0))
+        negative_growth_pe = float(hyperparams.get("negative_growth_pe", 5.0))
+
+        # Same clamp order as _clamp(): max(lo, min(hi, v))
+        growth_pe = np.maximum(min_growth_pe, np.minimum(max_growth_pe, eps_cagr_5y * 100.0))
+        growth_pe = np.where(eps_cagr_5y <= 0, negative_growth_pe, growth_pe)
+        return np.where(eps_ttm > 0, eps_ttm * growth_pe, np.nan)
@@ -1,7 +1,9 @@
 # strategies/psales_reversion.py
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 from strategies.strategy import Strategy, StrategyInputError
 
@@ -60,3 +62,20 @@ class PSalesReversionStrategy(Strategy):
         sales_per_share = revenue_ttm / shares_out
         fair_value = sales_per_share * target_ps
         return float(fair_value)
+
+    def run_many(self, columns: Dict[str, np.ndarray], hyperparams: Dict[str, Any]) -> Optional[np.ndarray]:
+        revenue_ttm = columns["revenue_ttm"]
+        shares_out = columns["shares_outstanding"]
+
+        target_ps = float(hyperparams.get("target_ps", 3.0))
+        min_ps_fair = float(hyperparams.get("min_ps_fair", 0.3))
+        max_ps_fair = float(hyperparams.get("max_ps_fair", 8.0))
+        if min_ps_fair <= 0 or max_ps_fair <= 0 or min_ps_fair > max_ps_fair:
+            return None  # run() reports the invalid clamps per ticker
+
+        target_ps = _clamp(target_ps, min_ps_fair, max_ps_fair)
+
+        valid = (shares_out > 0) & (revenue_ttm > 0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fair_value = revenue_ttm / shares_out * target_ps
+        return np.where(valid, fair_value, np.nan)
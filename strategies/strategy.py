@@ -11,12 +11,16 @@ Conventions:
 - All inputs must be provided via 'params' with canonical keys (see README).
 - Strategies should raise StrategyInputError if required inputs are missing/invalid.
 - Strategies must return a float (can be float('nan') if not computable, but prefer raising).
+- Strategies may also implement run_many(columns, hyperparams) to value every
+  ticker of a run in one NumPy pass; run() stays the reference implementation.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import numpy as np
 
 
 class StrategyError(RuntimeError):
@@ -43,3 +47,13 @@ class Strategy(ABC):
         raise StrategyInputError with a clear message if something is missing.
         """
         raise NotImplementedError
+
+    def run_many(self, columns: Dict[str, np.ndarray], hyperparams: Dict[str, Any]) -> Optional[np.ndarray]:
+        """
+        Optional vectorized run() over a whole run's tickers. `columns` maps each
+        metric key to a float64 array (NaN where missing); `hyperparams` holds the
+        strategy's scalar parameters. Return fair values aligned with the columns,
+        NaN wherever run() would raise, or None (the default) when the strategy
+        has no vectorized form. Non-finite entries are recomputed with run().
+        """
+        return None
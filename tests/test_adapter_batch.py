@@ -0,0 +1,88 @@
+# tests/test_adapter_batch.py
+import pytest
+
+from adapters.adapter import (
+    DataNotAvailable,
+    MetricAdapter,
+    is_rate_limited,
+    retry_after_seconds,
+    retry_on_failure,
+)
+
+
+class _EchoAdapter(MetricAdapter):
+    def __init__(self):
+        self._name = "echo"
+
+    def get_name(self) -> str:
+        return self._name
+
+    def fetch(self, ticker: str) -> float:
+        if ticker == "BAD":
+            raise DataNotAvailable(f"{self._name}: no data for {ticker}")
+        return float(len(ticker))
+
+
+def test_fetch_many_returns_value_or_exception_per_ticker():
+    out = _EchoAdapter().fetch_many(["AAPL", "BAD", "MSFT", "AAPL"])
+    assert list(out) == ["AAPL", "BAD", "MSFT"]
+    assert out["AAPL"] == 4.0
+    assert out["MSFT"] == 4.0
+    assert isinstance(out["BAD"], DataNotAvailable)
+
+
+class _FlakyAdapter(_EchoAdapter):
+    def __init__(self, failures: int):
+        super().__init__()
+        self.calls = 0
+        self.failures = failures
+
+    @retry_on_failure(max_retries=3, delay=0.0)
+    def fetch(self, ticker: str) -> float:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("transient")
+        return 1.0
+
+
+def test_retry_on_failure_retries_then_wraps_final_error():
+    ok = _FlakyAdapter(failures=2)
+    assert ok.fetch("AAPL") == 1.0 and ok.calls == 3
+
+    bad = _FlakyAdapter(failures=5)
+    with pytest.raises(DataNotAvailable):
+        bad.fetch("AAPL")
+    assert bad.calls == 3
+
+
+def test_retry_after_seconds_reads_header_from_exception_chain():
+    class _Resp:
+        headers = {"Retry-After": "7"}
+
+    err = ConnectionError("429")
+    err.response = _Resp()
+    try:
+        try:
+            raise err
+        except ConnectionError as e:
+            raise DataNotAvailable("rate limited") from e
+    except DataNotAvailable as wrapped:
+        assert retry_after_seconds(wrapped) == 7.0
+    assert retry_after_seconds(ValueError("no response")) is None
+
+
+def test_is_rate_limited_prefers_status_over_message():
+    class _Resp:
+        def __init__(self, status):
+            self.status_code = status
+            self.headers = {}
+
+    throttled = ConnectionError("boom")
+    throttled.response = _Resp(429)
+    server_error = ConnectionError("rate limit exceeded upstream")
+    server_error.response = _Resp(500)
+
+    assert is_rate_limited(throttled)
+    assert not is_rate_limited(server_error)
+    assert is_rate_limited(DataNotAvailable("quarterly cashflow unavailable (possibly rate limited)"))
+    assert not is_rate_limited(ValueError("bad payload"))
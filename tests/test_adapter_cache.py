@@ -0,0 +1,61 @@
+# tests/test_adapter_cache.py
+import pytest
+
+from adapters._cache import TTLCache, cached, ttl_cache
+from adapters.adapter import DataNotAvailable
+
+
+class _Counting:
+    def __init__(self):
+        self.calls = 0
+
+    def get_name(self) -> str:
+        return "counting"
+
+    @ttl_cache(ttl=60)
+    def fetch(self, ticker: str) -> float:
+        self.calls += 1
+        if ticker.upper() == "BAD":
+            raise DataNotAvailable("counting: nope")
+        return 1.0
+
+
+def test_ttl_cache_memoizes_per_ticker_case_insensitive():
+    a = _Counting()
+    assert a.fetch("aapl") == 1.0
+    assert a.fetch("AAPL") == 1.0
+    assert a.calls == 1
+
+
+def test_ttl_cache_does_not_cache_failures():
+    a = _Counting()
+    for _ in range(2):
+        with pytest.raises(DataNotAvailable):
+            a.fetch("BAD")
+    assert a.calls == 2
+
+
+def test_ttl_cache_expiry_and_maxsize():
+    c = TTLCache(maxsize=2, ttl=0.0)
+    c.set("a", 1)
+    assert c.get("a") is None
+    c = TTLCache(maxsize=2, ttl=60)
+    for k in "abc":
+        c.set(k, k)
+    assert len(c) == 2 and c.get("a") is None
+
+
+def test_disk_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv("AMPYFIN_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    def fn():
+        calls.append(1)
+        return 2.5
+
+    assert cached("demo", "brk/b", 60, fn) == 2.5
+    assert cached("demo", "BRK/B", 60, fn) == 2.5
+    assert len(calls) == 1
+    assert (tmp_path / "demo" / "BRK_B.json").exists()
+    assert cached("demo", "BRK/B", 0, fn) == 2.5  # expired -> recomputed
+    assert len(calls) == 2
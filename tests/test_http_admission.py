@@ -0,0 +1,73 @@
+# tests/test_http_admission.py
+import asyncio
+import threading
+import time
+
+from adapters._http import AdaptiveAdmission, AsyncAdaptiveAdmission
+
+
+def test_adaptive_admission_shrinks_on_throttle_and_recovers():
+    gate = AdaptiveAdmission(4, recovery=2)
+    gate.observe(429)
+    gate.observe(503)
+    assert gate.limit == 2
+    for _ in range(4):
+        gate.observe(200)
+    assert gate.limit == 4
+    gate.observe(200)
+    assert gate.limit == 4  # never above the initial cap
+
+
+def test_adaptive_admission_counts_concurrent_throttles():
+    gate = AdaptiveAdmission(64)
+    threads = [threading.Thread(target=lambda: [gate.observe(429) for _ in range(5)]) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert gate.limit == 64 - 40
+
+
+def test_adaptive_admission_bounds_in_flight():
+    gate = AdaptiveAdmission(2)
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    def work():
+        with gate:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert peak[0] == 2
+
+
+def test_async_adaptive_admission_shrinks_and_bounds_in_flight():
+    async def main():
+        gate = AsyncAdaptiveAdmission(3, recovery=2)
+        await gate.observe(429)
+        assert gate.limit == 2
+        active, peak = [0], [0]
+
+        async def work():
+            async with gate:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+                await asyncio.sleep(0.01)
+                active[0] -= 1
+
+        await asyncio.gather(*(work() for _ in range(8)))
+        assert peak[0] == 2
+        for _ in range(4):
+            await gate.observe(200)
+        assert gate.limit == 3  # back to, never above, the initial cap
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+# tests/test_process_vectorized.py
+import math
+
+import numpy as np
+
+from pipeline.context import PipelineContext
+from pipeline.stages import process_stage
+from pipeline.stages.result_stage import _fair_value_matrix
+from registries.strategy_registry import get_default_hyperparams, get_strategy_factory
+
+NAMES = ["peter_lynch", "psales_reversion", "fcf_yield", "graham_number"]
+
+
+def test_vectorized_strategies_match_scalar_run(monkeypatch):
+    monkeypatch.setattr(process_stage, "get_enabled_strategy_names", lambda: list(NAMES))
+    ctx = PipelineContext.new_run()
+    ctx.tickers = ["A", "B", "C", "D", "E"]
+    ctx.metrics_by_ticker = {
+        "A": {"eps_ttm": 2.0, "eps_cagr_5y": 0.12, "revenue_ttm": 1e9, "shares_outstanding": 1e8,
+              "fcf_ttm": 6.5e7, "book_value_per_share": 20.0},
+        "B": {"eps_ttm": -1.0, "eps_cagr_5y": -0.05, "revenue_ttm": 5e8, "shares_outstanding": None,
+              "fcf_ttm": 1e6, "book_value_per_share": 4.0},
+        "C": {"eps_ttm": 3.0, "eps_cagr_5y": 0.9, "revenue_ttm": 0.0, "shares_outstanding": 1e7,
+              "fcf_ttm": -2e6, "book_value_per_share": -1.0},
+        "D": {"eps_ttm": 1.5, "eps_cagr_5y": float("nan")},
+        "E": {},
+    }
+    process_stage.run_process_stage(ctx, {"peter_lynch": {"max_growth_pe": 30.0}})
+
+    for sname in NAMES:
+        strat = get_strategy_factory(sname)()
+        hp = {**get_default_hyperparams(sname), **ctx.hyperparam_overrides.get(sname, {})}
+        for tk in ctx.tickers:
+            try:
+                expected, err = float(strat.run({**ctx.metrics_by_ticker[tk], **hp})), None
+            except Exception as e:
+                expected, err = None, str(e)
+            got = ctx.fair_values[tk][sname]
+            if expected is None:
+                assert got is None and ctx.strategy_errors[tk][sname] == err
+            else:
+                assert got == expected or (math.isnan(got) and math.isnan(expected))
+    assert ctx.fair_values["A"]["peter_lynch"] == 24.0
+    assert ctx.fair_values["A"]["psales_reversion"] == 30.0
+    rebuilt = _fair_value_matrix(ctx.tickers, ctx.strategy_names, ctx.fair_values)
+    np.testing.assert_array_equal(ctx.fair_value_matrix, rebuilt)
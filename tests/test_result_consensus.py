@@ -0,0 +1,36 @@
+# tests/test_result_consensus.py
+import math
+
+import numpy as np
+
+from pipeline.stages.result_stage import _consensus_table, _fair_value_matrix
+
+
+def test_consensus_table_linear_percentiles():
+    # One ticker: None / NaN are ignored, leaving [3, 1, 10, 4]
+    fair_values = {"A": {"s1": 3.0, "s2": None, "s3": 1.0, "s4": float("nan"), "s5": 10.0, "s6": 4}}
+    names = ["s1", "s2", "s3", "s4", "s5", "s6"]
+    fv = _fair_value_matrix(["A"], names, fair_values)
+    p50, p25, p75, disc = _consensus_table(fv, np.array([2.0]))
+    assert math.isclose(p50[0], 3.5)
+    assert math.isclose(p25[0], 2.5)
+    assert math.isclose(p75[0], 5.5)
+    assert math.isclose(disc[0], 3.5 / 2.0 - 1.0)
+
+
+def test_consensus_table_rows_and_missing_values():
+    fair_values = {"A": {"s1": 3.0, "s2": None, "s3": 10.0}, "B": {"s1": None}, "C": {"s1": 4.0, "s3": 1.0}}
+    tickers, names = ["A", "B", "C"], ["s1", "s2", "s3"]
+    fv = _fair_value_matrix(tickers, names, fair_values)
+    p50, p25, p75, disc = _consensus_table(fv, np.array([5.0, 1.0, 0.0]))
+    np.testing.assert_allclose(p50[[0, 2]], [6.5, 2.5])
+    np.testing.assert_allclose(p25[[0, 2]], [4.75, 1.75])
+    np.testing.assert_allclose(p75[[0, 2]], [8.25, 3.25])
+    assert math.isnan(p50[1]) and math.isnan(p25[1]) and math.isnan(p75[1])
+    assert math.isclose(disc[0], 6.5 / 5.0 - 1.0)
+    assert math.isnan(disc[1]) and math.isnan(disc[2])
+
+
+def test_consensus_table_without_strategies():
+    p50, p25, p75, disc = _consensus_table(np.empty((2, 0)), np.array([1.0, 2.0]))
+    assert all(np.isnan(a).all() and a.shape == (2,) for a in (p50, p25, p75, disc))